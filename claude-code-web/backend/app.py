@@ -1,28 +1,53 @@
-from flask import Flask, request, jsonify, send_from_directory
+import os
+
+# Mode asynchrone de Socket.IO: gevent (greenlets) par défaut, threading en repli.
+# Le monkey-patch doit précéder tous les autres imports pour rendre la bibliothèque
+# standard (sockets, subprocess, threading, time) coopérative.
+ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'gevent')
+if ASYNC_MODE == 'gevent':
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+    except ImportError:
+        ASYNC_MODE = 'threading'
+
+from flask import Flask, request, jsonify, send_from_directory, g
 from flask_socketio import SocketIO, emit, join_room
 from flask_cors import CORS
-import os
 import subprocess
 import time
 import json
+import re
 import jwt
 import uuid
-import docker
-import requests
-from datetime import datetime, timedelta
+import functools
+from datetime import datetime
 import threading
+import selectors
 import logging
+from logging.handlers import RotatingFileHandler, MemoryHandler
+import hashlib
+from collections import OrderedDict
+from tmux_channel import TmuxCommandChannel
 
 # Configuration du logging
+# Fichier rotatif derrière un tampon mémoire: écriture par lots, vidage immédiat dès une erreur
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+log_file_handler = RotatingFileHandler('/var/log/claude-web.log', maxBytes=10_000_000, backupCount=3)
+log_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('/var/log/claude-web.log')
+        MemoryHandler(1024, flushLevel=logging.ERROR, target=log_file_handler)
     ]
 )
 logger = logging.getLogger(__name__)
+logger.info(f"Mode asynchrone Socket.IO: {ASYNC_MODE}")
+
+# Journalisation détaillée de Socket.IO/Engine.IO (chaque paquet, ping/pong): désactivée par défaut
+SOCKETIO_DEBUG = os.environ.get('DEBUG_SIO', '').lower() in ('1', 'true', 'yes')
 
 app = Flask(__name__, static_folder='../frontend/dist')
 # Configuration CORS avec origines spécifiques (pas de wildcard)
@@ -38,10 +63,10 @@ CORS(app,
 socketio = SocketIO(
     app, 
     cors_allowed_origins=allowed_origins,
-    async_mode='threading',
+    async_mode=ASYNC_MODE,
     path='/socket.io/',
-    logger=True,
-    engineio_logger=True,
+    logger=SOCKETIO_DEBUG,
+    engineio_logger=SOCKETIO_DEBUG,
     ping_timeout=60,
     ping_interval=25,
     always_connect=True
@@ -54,41 +79,240 @@ DOCKER_PATH = '/root/docker'
 CLAUDE_CODE_PATH = '/root/docker/claude-code'
 N8N_API_URL = os.environ.get('N8N_API_URL', 'https://n8n.colaig.fr')
 N8N_API_KEY = os.environ.get('N8N_API_KEY', '')
+N8N_TIMEOUT = 5  # secondes
+TMUX_SOCKET_DIR = '/tmp/tmux-0'
+TMUX_SOCKET = f'{TMUX_SOCKET_DIR}/default'
+CONTROL_MODE_COALESCE_DELAY = 0.05  # secondes
+CONTROL_MODE_IDLE_TIMEOUT = 5  # secondes
+MAX_OUTPUT_MONITORS = int(os.environ.get('MAX_OUTPUT_MONITORS', '64'))
+TMUX_SETTLE_TIMEOUT = 0.5  # secondes
+TMUX_SETTLE_POLL_INTERVAL = 0.02  # secondes
+FULL_CAPTURE_INTERVAL = 5  # secondes entre deux relectures complètes de l'historique
+CAPTURE_HISTORY_LINES = int(os.environ.get('CAPTURE_HISTORY_LINES', '1000'))
+TMUX_HISTORY_LIMIT = int(os.environ.get('TMUX_HISTORY_LIMIT', '5000'))
+PUBLIC_API_PATHS = {'/api/auth'}
+DOCKER_APPS_CACHE_TTL = 2  # secondes
+PROJECTS_CACHE_TTL = 5  # secondes
+TOKEN_CACHE_SIZE = 4096
+TOKEN_CACHE_TTL = 30  # secondes
+TOKEN_LIFETIME = 86400  # secondes (1 jour)
+CLAUDE_READY_TIMEOUT = 10  # secondes
+CLAUDE_READY_MARKERS = ('Try "how do I log an error?"', 'cwd:')
+PROJECT_READY_TTL = 30  # secondes pendant lesquelles une session prête n'est pas resondée
+STAGING_URL_TEMPLATE = 'https://{}-staging.colaig.fr'
+PRODUCTION_URL_TEMPLATE = 'https://{}.colaig.fr'
+DEVELOPMENT_URL = 'http://localhost:3000'  # Port par défaut
+PROJECT_METADATA_FILE = '.project.json'
+
+# Date de démarrage du serveur (valeur de repli pour les dates inconnues)
+STARTED_AT = datetime.now().isoformat()
 
-# Client Docker
-try:
-    docker_client = docker.from_env()
-    logger.info("Docker client initialisé avec succès")
-except Exception as e:
-    logger.error(f"Erreur lors de l'initialisation du client Docker: {str(e)}")
-    docker_client = None
+# Commandes du message de bienvenue tapées dans la session principale
+WELCOME_BANNER_KEYS = (
+    'clear',
+    'echo "\\033[1;32mBienvenue dans Claude Code Web!\\033[0m"',
+    'echo "\\033[1;36mTerminal interactif pour Claude Code\\033[0m"',
+    'echo "-------------------------------------"',
+    'echo ""',
+    'export PATH=/root/.npm-global/bin:$PATH',
+    'cd /root/docker',
+    'ls -la',
+    'echo ""',
+    'echo "\\033[1;33mPrêt à utiliser Claude Code...\\033[0m"',
+    'echo "\\033[0;37mTapez votre question ou commande ci-dessous:\\033[0m"',
+)
 
-# Stockage des sessions actives
+# Message affiché lorsque la session n'a encore rien produit
+DEFAULT_WELCOME_MESSAGE = (
+    "Bienvenue dans Claude Code Web\n\n"
+    "Terminal interactif pour Claude Code\n"
+    "--------------------------------------\n\n"
+    "Prêt à recevoir vos commandes...\n"
+    "Tapez votre message et appuyez sur Ctrl+Enter pour l'envoyer."
+)
+
+# Client Docker (importé et connecté à la première utilisation seulement)
+@functools.lru_cache(maxsize=1)
+def get_docker_client():
+    """Retourne le client Docker partagé, ou None s'il est indisponible"""
+    try:
+        import docker
+        client = docker.from_env()
+        logger.info("Docker client initialisé avec succès")
+        return client
+    except Exception as e:
+        logger.error(f"Erreur lors de l'initialisation du client Docker: {str(e)}")
+        return None
+
+def start_container_state_watcher():
+    """Amorce l'état des conteneurs et lance l'écoute des événements Docker (une seule fois)"""
+    global _container_events_thread
+    with _container_states_lock:
+        if _container_events_thread is not None and _container_events_thread.is_alive():
+            return True
+        
+        docker_client = get_docker_client()
+        if not docker_client:
+            return False
+        
+        try:
+            # Ouvrir le flux avant l'amorçage: aucun événement intermédiaire n'est perdu
+            events = docker_client.api.events(decode=True, filters={'type': 'container'})
+            _container_states.clear()
+            for container in docker_client.api.containers(all=True):
+                if container["Names"]:
+                    _container_states[container["Names"][0].lstrip('/')] = container["State"]
+        except Exception as e:
+            logger.error(f"Erreur lors de l'amorçage de l'état des conteneurs: {str(e)}")
+            return False
+        
+        _container_events_thread = threading.Thread(
+            target=watch_container_events,
+            args=(events,),
+            name="docker-events",
+            daemon=True
+        )
+        _container_events_thread.start()
+        return True
+
+def watch_container_events(events):
+    """Applique les événements Docker (start, die, destroy...) à l'état des conteneurs"""
+    global _container_events_thread
+    try:
+        for event in events:
+            attributes = event.get('Actor', {}).get('Attributes', {})
+            name = attributes.get('name')
+            action = event.get('Action') or event.get('status') or ''
+            if not name:
+                continue
+            with _container_states_lock:
+                if action == 'destroy':
+                    _container_states.pop(name, None)
+                elif action == 'rename':
+                    _container_states.pop(attributes.get('oldName', '').lstrip('/'), None)
+                    _container_states[name] = _container_states.get(name, 'created')
+                elif action in ('start', 'restart', 'unpause'):
+                    _container_states[name] = 'running'
+                elif action in ('die', 'stop'):
+                    _container_states[name] = 'exited'
+                elif action == 'pause':
+                    _container_states[name] = 'paused'
+                elif action == 'create':
+                    _container_states[name] = 'created'
+    except Exception as e:
+        logger.error(f"Flux d'événements Docker interrompu: {str(e)}")
+    finally:
+        # L'état n'est plus garanti: oublier le thread pour que le prochain appel le réamorce aussitôt
+        with _container_states_lock:
+            _container_states.clear()
+            if _container_events_thread is threading.current_thread():
+                _container_events_thread = None
+
+def project_container_status(project_name):
+    """Statut d'un projet d'après ses conteneurs: active, developing ou inactive"""
+    if not start_container_state_watcher():
+        return "inactive"
+    with _container_states_lock:
+        states = [state for name, state in _container_states.items() if project_name in name]
+    # Même périmètre que `docker ps` (sans -a): conteneurs en cours, en pause ou en redémarrage
+    if any(state in ('running', 'paused', 'restarting') for state in states):
+        return "active"
+    if states:
+        return "developing"
+    return "inactive"
+
+# Session HTTP n8n: connexions persistantes (keep-alive) réutilisées entre les appels
+@functools.lru_cache(maxsize=1)
+def get_n8n_session():
+    """Retourne la session HTTP n8n partagée (créée à la première utilisation)"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.headers['X-N8N-API-KEY'] = N8N_API_KEY
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
+
+# Stockage des sessions actives (mutations protégées par _sessions_lock)
 active_sessions = {}
 output_threads = {}
+_sessions_lock = threading.Lock()
+_monitor_slots = threading.BoundedSemaphore(MAX_OUTPUT_MONITORS)
+# Sessions dont le prochain envoi doit être complet (un nouveau client vient de rejoindre la room)
+_output_resync = set()
+# Événement de réveil du moniteur de chaque session (signalé par tmux ou par un nouveau client)
+_output_wakeups = {}
 
-# Stockage des projets et sessions par projet
+# Stockage des projets et sessions par projet (project_sessions protégé par _sessions_lock)
 project_sessions = {}
+# Dernière confirmation que Claude Code était prêt (nom de session -> time.monotonic())
+_project_ready_at = {}
 project_data = {}
 
+# Surveillance des sessions projet: un seul thread lit tous les clients en mode contrôle
+_project_monitors = {}
+_project_monitors_lock = threading.Lock()
+_project_monitor_thread = None
+_project_selector = selectors.DefaultSelector()
+_project_wakeup_read, _project_wakeup_write = os.pipe()
+_project_selector.register(_project_wakeup_read, selectors.EVENT_READ, None)
+
+# Cache de la liste des conteneurs Docker
+_docker_apps_cache = {}
+_docker_apps_cache_lock = threading.Lock()
+
+# Cache de la liste des projets
+_projects_cache = {}
+_projects_cache_lock = threading.Lock()
+
+# État des conteneurs (nom -> état), tenu à jour par le flux d'événements Docker
+_container_states = {}
+_container_states_lock = threading.Lock()
+_container_events_thread = None
+
+# Cache des tokens déjà vérifiés (clé: empreinte SHA-256, jamais le token brut)
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+# Instance PyJWT réutilisée (options de vérification construites une seule fois)
+jwt_codec = jwt.PyJWT(options={'verify_signature': True, 'verify_exp': True, 'require': ['exp']})
+
+# Canal de commandes tmux persistant (évite un fork de tmux par commande)
+tmux_channel = TmuxCommandChannel(TMUX_SOCKET)
+
+def run_tmux(*args):
+    """Exécute une commande tmux sur le socket partagé (sans passer par un shell)"""
+    result = tmux_channel.run(args)
+    if result is None:
+        result = subprocess.run(["tmux", "-S", TMUX_SOCKET, *args], capture_output=True, text=True)
+    return result
+
+def run_tmux_batch(*commands):
+    """Exécute plusieurs commandes tmux en un seul appel (séparées par ';')"""
+    args = []
+    for i, command in enumerate(commands):
+        if i:
+            args.append(";")
+        args.extend(command)
+    return run_tmux(*args)
+
 # Au démarrage, nettoyer toutes les anciennes sessions tmux
 def cleanup_old_sessions():
     """Nettoie les anciennes sessions tmux au démarrage"""
     logger.info("Nettoyage des anciennes sessions tmux...")
     try:
         # Liste toutes les sessions tmux
-        result = subprocess.run("tmux list-sessions -F '#{session_name}'", 
-                              shell=True, capture_output=True, text=True)
+        result = run_tmux("list-sessions", "-F", "#{session_name}")
         
         for line in result.stdout.strip().split('\n'):
             if line.startswith('claude_'):
                 # Nettoyage des sessions utilisateur
                 session_name = line.strip()
                 logger.info(f"Nettoyage de l'ancienne session: {session_name}")
-                subprocess.run(f"tmux kill-session -t {session_name}", shell=True)
+                run_tmux("kill-session", "-t", session_name)
         
         # Tuer aussi la session principale si elle existe
-        subprocess.run("tmux kill-session -t claude-code-session 2>/dev/null || true", shell=True)
+        run_tmux("kill-session", "-t", "claude-code-session")
         logger.info("Nettoyage des sessions terminé")
     except Exception as e:
         logger.error(f"Erreur lors du nettoyage des anciennes sessions: {str(e)}")
@@ -101,18 +325,55 @@ def generate_token(user_id, username):
     payload = {
         'user_id': user_id,
         'username': username,
-        'exp': datetime.utcnow() + timedelta(days=1)
+        'exp': int(time.time()) + TOKEN_LIFETIME
     }
-    return jwt.encode(payload, SECRET_KEY, algorithm='HS256')
+    return jwt_codec.encode(payload, SECRET_KEY, algorithm='HS256')
 
 def verify_token(token):
-    """Vérifie un token JWT"""
+    """Vérifie un token JWT (avec cache des vérifications réussies)"""
+    if not token:
+        return None
+    
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached:
+            payload, expires_at = cached
+            if now < expires_at:
+                _token_cache.move_to_end(key)
+                return payload
+            del _token_cache[key]
+    
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
-        return payload
+        payload = jwt_codec.decode(token, SECRET_KEY, algorithms=['HS256'])
     except Exception as e:
         logger.error(f"Erreur de vérification du token: {str(e)}")
         return None
+    
+    # Seules les vérifications réussies sont mises en cache, jamais au-delà de l'expiration du token
+    expires_at = min(payload.get('exp', now), now + TOKEN_CACHE_TTL)
+    with _token_cache_lock:
+        _token_cache[key] = (payload, expires_at)
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    
+    return payload
+
+def tmux_pane_signature(target):
+    """Retourne une signature légère de l'état du panneau (historique et curseur)"""
+    return run_tmux("display-message", "-p", "-t", target, "#{history_size} #{cursor_x} #{cursor_y}").stdout
+
+def wait_for_tmux_change(target, signature, timeout=TMUX_SETTLE_TIMEOUT):
+    """Attend que le panneau s'écarte de la signature donnée, au plus `timeout` secondes"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if tmux_pane_signature(target) != signature:
+            return True
+        time.sleep(TMUX_SETTLE_POLL_INTERVAL)
+    return False
 
 def create_tmux_session(session_id):
     """Crée une nouvelle session tmux pour Claude Code"""
@@ -121,54 +382,50 @@ def create_tmux_session(session_id):
     logger.info("Vérification de la session principale Claude Code")
     
     # Arrêter les sessions existantes pour tout nettoyer
-    subprocess.run("tmux kill-session -t claude-code-session 2>/dev/null || true", shell=True)
-    subprocess.run(f"tmux kill-session -t claude_{session_id} 2>/dev/null || true", shell=True)
+    # (appels séparés: une erreur tmux interrompt le reste d'un lot)
+    run_tmux("kill-session", "-t", "claude-code-session")
+    run_tmux("kill-session", "-t", f"claude_{session_id}")
     
     logger.info("Création d'une nouvelle session Claude Code principale")
     
     # S'assurer que les sockets tmux ont les bonnes permissions
-    subprocess.run("mkdir -p /tmp/tmux-0", shell=True)
-    subprocess.run("chmod -R 777 /tmp/tmux-0", shell=True)
+    os.makedirs(TMUX_SOCKET_DIR, exist_ok=True)
+    os.chmod(TMUX_SOCKET_DIR, 0o777)
     
     # Exporter la variable TMUX pour éviter des conflits de sessions
     os.environ.pop('TMUX', None)
     
-    # Créer une session tmux pour Claude Code avec un contenu initial visible
-    subprocess.run("cd /root && TMUX= tmux -S /tmp/tmux-0/default new-session -d -s claude-code-session", shell=True)
+    # Créer la session principale (history-limit n'agit que sur les panneaux créés ensuite:
+    # le fixer avant la session)
+    run_tmux_batch(
+        ["set-option", "-g", "history-limit", str(TMUX_HISTORY_LIMIT)],
+        ["new-session", "-d", "-s", "claude-code-session", "-c", "/root"]
+    )
+    # Signature prise avant l'envoi des touches: une réaction immédiate du shell n'est pas manquée
+    signature = tmux_pane_signature("claude-code-session")
+    run_tmux_batch(
+        *[["send-keys", "-t", "claude-code-session", keys, "C-m"] for keys in WELCOME_BANNER_KEYS]
+    )
     
     # S'assurer que les permissions du socket sont correctes
-    subprocess.run("chmod 777 /tmp/tmux-0/default", shell=True)
-    
-    # Configurer l'environnement et afficher un message de bienvenue
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'clear' C-m", shell=True)
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'echo \"\\033[1;32mBienvenue dans Claude Code Web!\\033[0m\"' C-m", shell=True)
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'echo \"\\033[1;36mTerminal interactif pour Claude Code\\033[0m\"' C-m", shell=True)
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'echo \"-------------------------------------\"' C-m", shell=True)
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'echo \"\"' C-m", shell=True)
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'export PATH=/root/.npm-global/bin:$PATH' C-m", shell=True)
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'cd /root/docker' C-m", shell=True)
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'ls -la' C-m", shell=True)
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'echo \"\"' C-m", shell=True)
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'echo \"\\033[1;33mPrêt à utiliser Claude Code...\\033[0m\"' C-m", shell=True)
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'echo \"\\033[0;37mTapez votre question ou commande ci-dessous:\\033[0m\"' C-m", shell=True)
-    
-    # Attendre un peu pour que les commandes s'exécutent
-    time.sleep(3)
-    
-    # Créer une session utilisateur attachée à la session principale
-    logger.info(f"Création d'une nouvelle session utilisateur claude_{session_id}")
-    subprocess.run(f"TMUX= tmux -S /tmp/tmux-0/default new-session -d -s claude_{session_id} -t claude-code-session", shell=True)
+    if os.path.exists(TMUX_SOCKET):
+        os.chmod(TMUX_SOCKET, 0o777)
     
-    # Lancer Claude après avoir créé les sessions clones
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session 'echo \"\"' C-m", shell=True)
-    subprocess.run("tmux -S /tmp/tmux-0/default send-keys -t claude-code-session '/root/.npm-global/bin/claude' C-m", shell=True)
+    # Attendre que le shell commence à exécuter les commandes (sans délai fixe)
+    wait_for_tmux_change("claude-code-session", signature)
     
-    # Synchroniser l'écran
-    time.sleep(2)
-    subprocess.run(f"tmux -S /tmp/tmux-0/default send-keys -t claude_{session_id} ' ' C-h", shell=True)
+    # Créer une session utilisateur attachée à la session principale, puis lancer Claude
+    logger.info(f"Création d'une nouvelle session utilisateur claude_{session_id}")
+    signature = tmux_pane_signature("claude-code-session")
+    run_tmux_batch(
+        ["new-session", "-d", "-s", f"claude_{session_id}", "-t", "claude-code-session"],
+        ["send-keys", "-t", "claude-code-session", 'echo ""', "C-m"],
+        ["send-keys", "-t", "claude-code-session", "/root/.npm-global/bin/claude", "C-m"]
+    )
     
-    # Ajuster la taille du tampon d'historique pour capturer plus de contenu
-    subprocess.run("tmux -S /tmp/tmux-0/default set-option -g history-limit 5000", shell=True)
+    # Synchroniser l'écran
+    wait_for_tmux_change("claude-code-session", signature)
+    run_tmux("send-keys", "-t", f"claude_{session_id}", " ", "C-h")
     
     logger.info(f"Session tmux claude_{session_id} créée et prête")
     
@@ -181,35 +438,16 @@ def create_tmux_session(session_id):
 def get_tmux_output(session_id):
     """Récupère la sortie de la session tmux"""
     try:
-        # Essayer d'abord la session principale (source de vérité)
-        cmd_main = f"tmux -S /tmp/tmux-0/default capture-pane -p -S -1000 -t claude-code-session"
-        result_main = subprocess.run(cmd_main, shell=True, capture_output=True, text=True)
-        main_output = result_main.stdout
-        
-        # Puis la session utilisateur comme backup
-        cmd = f"tmux -S /tmp/tmux-0/default capture-pane -p -S -1000 -t claude_{session_id}"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        user_output = result.stdout
-        
-        # Comparer et choisir le meilleur résultat
-        if len(main_output.strip()) > len(user_output.strip()):
-            logger.info(f"Utilisation de la sortie principale: {len(main_output)} caractères")
-            final_output = main_output
-        else:
-            logger.info(f"Utilisation de la sortie utilisateur: {len(user_output)} caractères")
-            final_output = user_output
+        # La session utilisateur est groupée avec la session principale: une seule capture suffit,
+        # nettoyée une seule fois (lstrip ne copie rien quand il n'y a pas d'espace en tête)
+        final_output = run_tmux(
+            "capture-pane", "-p", "-S", f"-{CAPTURE_HISTORY_LINES}", "-t", f"claude_{session_id}"
+        ).stdout.rstrip()
         
         # Si toujours pas de contenu, créer un message par défaut
-        if len(final_output.strip()) < 10:
+        if len(final_output.lstrip()) < 10:
             logger.warning("Sortie trop courte, ajout d'un message par défaut")
-            final_output = "Bienvenue dans Claude Code Web\n\n" + \
-                          "Terminal interactif pour Claude Code\n" + \
-                          "--------------------------------------\n\n" + \
-                          "Prêt à recevoir vos commandes...\n" + \
-                          "Tapez votre message et appuyez sur Ctrl+Enter pour l'envoyer."
-        
-        # Nettoyer la sortie
-        final_output = final_output.rstrip()
+            final_output = DEFAULT_WELCOME_MESSAGE
         
         return final_output
     
@@ -220,96 +458,234 @@ def get_tmux_output(session_id):
 
 def send_to_tmux(session_id, command):
     """Envoie une commande à la session tmux"""
-    # Échapper les caractères spéciaux dans la commande
-    escaped_command = command.replace("'", "'\\''")
-    
-    # Envoyer directement la commande à la session principale pour être sûr
-    logger.info(f"Envoi de la commande à la session principale: {escaped_command}")
-    cmd_main = f"tmux -S /tmp/tmux-0/default send-keys -t claude-code-session '{escaped_command}' C-m"
-    subprocess.run(cmd_main, shell=True)
-    
-    # Envoyer également à la session utilisateur
-    logger.info(f"Envoi de la commande à la session utilisateur: {escaped_command}")
-    cmd = f"tmux -S /tmp/tmux-0/default send-keys -t claude_{session_id} '{escaped_command}' C-m"
-    subprocess.run(cmd, shell=True)
-    
-    # Synchroniser les deux sessions
-    subprocess.run(f"tmux -S /tmp/tmux-0/default refresh-client -t claude_{session_id} 2>/dev/null || true", shell=True)
-    subprocess.run(f"tmux -S /tmp/tmux-0/default refresh-client -t claude-code-session 2>/dev/null || true", shell=True)
-    
-    # Attendre un peu pour que la commande s'exécute et que Claude Code réponde
-    time.sleep(2)
-    
-    # Capturer la sortie de la session principale Claude Code
-    output_main = subprocess.run(f"tmux -S /tmp/tmux-0/default capture-pane -p -S -1000 -t claude-code-session", 
-                            shell=True, capture_output=True, text=True).stdout
-    
-    # Capturer aussi la sortie de la session utilisateur
-    output_user = get_tmux_output(session_id)
+    # La commande est passée telle quelle en argument: aucun échappement shell nécessaire.
+    # La session utilisateur partage ses fenêtres avec la session principale: un seul envoi suffit.
+    logger.info(f"Envoi de la commande à la session claude_{session_id}: {command}")
+    signature = tmux_pane_signature(f"claude_{session_id}")
+    run_tmux("send-keys", "-t", f"claude_{session_id}", command, "C-m")
     
-    # Choisir l'output le plus complet
-    output = output_main if len(output_main) > len(output_user) else output_user
+    # Attendre que la session réagisse; la sortie est relayée par le moniteur,
+    # inutile de recapturer tout le panneau ici
+    wait_for_tmux_change(f"claude_{session_id}", signature)
     
-    logger.info(f"Commande envoyée: {command}, Réponse reçue de longueur {len(output)}")
+    logger.info(f"Commande envoyée: {command}")
+
+def start_output_monitor(key, target, *args):
+    """Démarre un thread de surveillance pour `key` s'il n'y en a pas déjà un actif
+    
+    Le nombre de moniteurs simultanés est borné par MAX_OUTPUT_MONITORS; un moniteur
+    terminé libère sa place et peut être relancé à la connexion suivante.
+    """
+    with _sessions_lock:
+        thread = output_threads.get(key)
+        if thread and thread.is_alive():
+            return False
+        
+        if not _monitor_slots.acquire(blocking=False):
+            logger.warning(f"Nombre maximal de moniteurs atteint ({MAX_OUTPUT_MONITORS}), surveillance de {key} refusée")
+            return False
+        
+        thread = threading.Thread(
+            target=run_output_monitor,
+            args=(key, target, *args),
+            name=f"monitor-{key}",
+            daemon=True
+        )
+        output_threads[key] = thread
     
-    return output
+    thread.start()
+    return True
+
+def run_output_monitor(key, target, *args):
+    """Exécute un moniteur puis le retire du registre et libère sa place"""
+    try:
+        target(*args)
+    finally:
+        with _sessions_lock:
+            if output_threads.get(key) is threading.current_thread():
+                del output_threads[key]
+        _monitor_slots.release()
+
+def start_tmux_control_client(target):
+    """Attache un client tmux en mode contrôle (lecture seule) à une session"""
+    return subprocess.Popen(
+        ["tmux", "-S", TMUX_SOCKET, "-C", "attach-session", "-r", "-t", target],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        errors='replace'
+    )
 
-def monitor_tmux_output(session_id, client_id):
-    """Surveille la sortie d'une session tmux et envoie les mises à jour via WebSocket"""
+def watch_tmux_control_client(control, changed, closed):
+    """Lit le flux du mode contrôle et signale chaque notification %output"""
+    try:
+        for line in control.stdout:
+            if line.startswith('%output'):
+                changed.set()
+            elif line.startswith('%exit'):
+                break
+    finally:
+        closed.set()
+        changed.set()
+
+def capture_tmux_pane(target, state):
+    """Capture un panneau tmux en ne relisant de l'historique que les lignes ajoutées
+    
+    Le panneau visible et la taille de l'historique sont lus en un seul appel. Si l'historique
+    a grandi, seules les nouvelles lignes sont capturées (-S -n -E -1); une capture complète
+    (CAPTURE_HISTORY_LINES lignes) n'est faite qu'au premier appel, si l'historique a été
+    vidé, et au plus tard toutes les FULL_CAPTURE_INTERVAL secondes.
+    """
+    result = run_tmux(
+        "display-message", "-p", "-t", target, "#{history_size}", ";",
+        "capture-pane", "-p", "-t", target
+    )
+    history_size, _, visible = result.stdout.partition("\n")
+    
+    now = time.monotonic()
+    if now < state.get('full_capture_at', 0):
+        if history_size == state['history_size']:
+            return state['scrollback'] + visible
+        
+        added = int(history_size or 0) - int(state['history_size'] or 0)
+        if 0 < added <= CAPTURE_HISTORY_LINES:
+            # Taille, nouvelles lignes et panneau visible lus dans un même lot (état cohérent)
+            result = run_tmux(
+                "display-message", "-p", "-t", target, "#{history_size}", ";",
+                "capture-pane", "-p", "-S", f"-{added}", "-E", "-1", "-t", target, ";",
+                "capture-pane", "-p", "-t", target
+            )
+            current_size, _, output = result.stdout.partition("\n")
+            if current_size == history_size:
+                lines = output.splitlines(keepends=True)
+                scrollback = (state['scrollback'] + "".join(lines[:added])).splitlines(keepends=True)
+                state['history_size'] = history_size
+                state['scrollback'] = "".join(scrollback[-CAPTURE_HISTORY_LINES:])
+                return state['scrollback'] + "".join(lines[added:])
+    
+    result = run_tmux(
+        "display-message", "-p", "-t", target, "#{history_size}", ";",
+        "capture-pane", "-p", "-S", f"-{CAPTURE_HISTORY_LINES}", "-t", target
+    )
+    history_size, _, full_output = result.stdout.partition("\n")
+    history_lines = min(int(history_size or 0), CAPTURE_HISTORY_LINES)
+    state['history_size'] = history_size
+    state['scrollback'] = "".join(full_output.splitlines(keepends=True)[:history_lines])
+    state['full_capture_at'] = now + FULL_CAPTURE_INTERVAL
+    return full_output
+
+def capture_tmux_output(session_id, state):
+    """Capture la sortie courante de la session utilisateur"""
+    return capture_tmux_pane(f"claude_{session_id}", state).rstrip()
+
+def common_prefix_length(a, b):
+    """Longueur du préfixe commun à deux chaînes (recherche dichotomique sur des tranches)"""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+def output_delta(previous, current):
+    """Calcule la mise à jour à envoyer: le client garde `offset` caractères et ajoute `data`
+    
+    L'offset est exprimé en unités UTF-16, comme les index des chaînes JavaScript.
+    """
+    prefix_length = common_prefix_length(previous, current)
+    prefix = current[:prefix_length]
+    offset = prefix_length if prefix.isascii() else len(prefix.encode('utf-16-le')) // 2
+    return {'offset': offset, 'data': current[prefix_length:]}
+
+def monitor_tmux_output(session_id):
+    """Surveille la sortie d'une session tmux et envoie les mises à jour à la room de la session
+    
+    tmux signale lui-même les changements via un client en mode contrôle (%output):
+    la capture n'est relancée que lorsque la session a réellement produit de la sortie.
+    Un seul moniteur par session, quel que soit le nombre de clients connectés.
+    """
     last_output = ""
-    logger.info(f"Démarrage de la surveillance pour la session {session_id}, client {client_id}")
+    capture_state = {}
+    logger.info(f"Démarrage de la surveillance pour la session {session_id}")
     
-    # Forcer une première mise à jour immédiate
     try:
-        # Capturer la sortie initiale et l'envoyer immédiatement
-        main_output = subprocess.run(f"tmux -S /tmp/tmux-0/default capture-pane -p -S -1000 -t claude-code-session", 
-                                  shell=True, capture_output=True, text=True).stdout
-        
-        user_output = get_tmux_output(session_id)
-        current_output = main_output if len(main_output) > len(user_output) else user_output
-        
-        socketio.emit('tmux_output', {
-            'session_id': session_id,
-            'output': current_output
-        }, to=client_id)
-        
-        last_output = current_output
+        control = start_tmux_control_client(f"claude_{session_id}")
     except Exception as e:
-        logger.error(f"Erreur lors de l'envoi de la sortie initiale pour {session_id}: {str(e)}")
+        logger.error(f"Impossible d'attacher le mode contrôle tmux pour {session_id}: {str(e)}")
+        return
     
-    while session_id in active_sessions:
-        try:
-            # Vérifier d'abord la session principale avec plus de lignes d'historique
-            main_output = subprocess.run(f"tmux -S /tmp/tmux-0/default capture-pane -p -S -1000 -t claude-code-session", 
-                                      shell=True, capture_output=True, text=True).stdout
+    changed = threading.Event()
+    closed = threading.Event()
+    with _sessions_lock:
+        _output_wakeups[session_id] = changed
+    threading.Thread(
+        target=watch_tmux_control_client,
+        args=(control, changed, closed),
+        daemon=True
+    ).start()
+    
+    # Forcer une première mise à jour immédiate
+    changed.set()
+    
+    try:
+        while session_id in active_sessions and not closed.is_set():
+            # Attendre une notification de tmux (le délai permet de revérifier l'état de la session)
+            if not changed.wait(timeout=CONTROL_MODE_IDLE_TIMEOUT) and session_id not in _output_resync:
+                continue
             
-            # Puis capturer la sortie de la session utilisateur
-            user_output = get_tmux_output(session_id)
+            # Regrouper les rafales de notifications en une seule capture
+            time.sleep(CONTROL_MODE_COALESCE_DELAY)
+            changed.clear()
             
-            # Choisir l'output le plus complet
-            current_output = main_output if len(main_output) > len(user_output) else user_output
+            # Un nouveau client n'a pas l'état précédent: renvoyer la sortie complète
+            with _sessions_lock:
+                if session_id in _output_resync:
+                    _output_resync.discard(session_id)
+                    last_output = ""
             
-            # Comparer et envoyer si différent
-            if current_output != last_output:
-                logger.info(f"Nouvelle sortie détectée pour la session {session_id}, envoi au client {client_id}")
-                socketio.emit('tmux_output', {
-                    'session_id': session_id,
-                    'output': current_output
-                }, to=client_id)
-                
-                last_output = current_output
+            try:
+                current_output = capture_tmux_output(session_id, capture_state)
                 
-                # Synchroniser les sessions entre elles
-                subprocess.run(f"tmux -S /tmp/tmux-0/default refresh-client -t claude_{session_id} 2>/dev/null || true", shell=True)
-                subprocess.run(f"tmux -S /tmp/tmux-0/default refresh-client -t claude-code-session 2>/dev/null || true", shell=True)
-            
-            # Attendre un court moment avant de vérifier à nouveau
-            time.sleep(0.3)
-        except Exception as e:
-            logger.error(f"Erreur lors de la surveillance de la session {session_id}: {str(e)}")
-            time.sleep(1)  # Attendre un peu plus longtemps en cas d'erreur
+                # Comparer et n'envoyer que la partie modifiée
+                if current_output != last_output and len(current_output.strip()) >= 10:
+                    logger.info(f"Nouvelle sortie détectée pour la session {session_id}, envoi à la room")
+                    socketio.emit('tmux_output', {
+                        'session_id': session_id,
+                        **output_delta(last_output, current_output)
+                    }, to=session_id)
+                    
+                    last_output = current_output
+            except Exception as e:
+                logger.error(f"Erreur lors de la surveillance de la session {session_id}: {str(e)}")
+    finally:
+        with _sessions_lock:
+            if _output_wakeups.get(session_id) is changed:
+                del _output_wakeups[session_id]
+        if control.poll() is None:
+            control.terminate()
+    
+    logger.info(f"Arrêt de la surveillance pour la session {session_id}")
+
+@app.before_request
+def require_api_auth():
+    """Exige un token Bearer valide pour les routes /api/, le payload est exposé dans g.user"""
+    path = request.path
+    if not path.startswith('/api/') or path in PUBLIC_API_PATHS or request.method == 'OPTIONS':
+        return None
+    
+    auth_header = request.headers.get('Authorization', '')
+    if not auth_header.startswith('Bearer '):
+        return jsonify({"error": "Non autorisé"}), 401
     
-    logger.info(f"Arrêt de la surveillance pour la session {session_id}, client {client_id}")
+    payload = verify_token(auth_header[7:])
+    if not payload:
+        return jsonify({"error": "Token invalide"}), 401
+    
+    g.user = payload
+    return None
 
 @app.route('/')
 def serve_index():
@@ -354,21 +730,13 @@ def authenticate():
 @app.route('/api/session/new', methods=['POST'])
 def new_session():
     """Crée une nouvelle session tmux"""
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({"error": "Non autorisé"}), 401
-    
-    token = auth_header.split(' ')[1]
-    payload = verify_token(token)
-    if not payload:
-        return jsonify({"error": "Token invalide"}), 401
-    
-    user_id = payload['user_id']
-    username = payload['username']
+    user_id = g.user['user_id']
+    username = g.user['username']
     
     session_id = str(uuid.uuid4())
     create_tmux_session(session_id)
-    active_sessions[session_id] = user_id
+    with _sessions_lock:
+        active_sessions[session_id] = user_id
     
     logger.info(f"Nouvelle session {session_id} créée pour {username}")
     return jsonify({"session_id": session_id})
@@ -376,18 +744,8 @@ def new_session():
 @app.route('/api/sessions', methods=['GET'])
 def list_sessions():
     """Liste les sessions tmux actives"""
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({"error": "Non autorisé"}), 401
-    
-    token = auth_header.split(' ')[1]
-    payload = verify_token(token)
-    if not payload:
-        return jsonify({"error": "Token invalide"}), 401
-    
     # Récupérer toutes les sessions tmux
-    result = subprocess.run("tmux list-sessions -F '#{session_name}'", 
-                          shell=True, capture_output=True, text=True)
+    result = run_tmux("list-sessions", "-F", "#{session_name}")
     
     sessions = []
     for line in result.stdout.strip().split('\n'):
@@ -403,24 +761,22 @@ def list_sessions():
 @app.route('/api/docker/apps', methods=['GET'])
 def list_docker_apps():
     """Liste les applications Docker"""
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({"error": "Non autorisé"}), 401
-    
-    token = auth_header.split(' ')[1]
-    payload = verify_token(token)
-    if not payload:
-        return jsonify({"error": "Token invalide"}), 401
-    
     try:
+        docker_client = get_docker_client()
         if docker_client:
-            containers = docker_client.containers.list()
-            return jsonify([{
-                "id": container.id,
-                "name": container.name,
-                "status": container.status,
-                "image": container.image.tags[0] if container.image.tags else "none"
-            } for container in containers])
+            now = time.monotonic()
+            with _docker_apps_cache_lock:
+                if now >= _docker_apps_cache.get('expires_at', 0):
+                    # API bas niveau: un seul appel /containers/json, des dicts bruts, aucun objet Container
+                    _docker_apps_cache['apps'] = [{
+                        "id": container["Id"],
+                        "name": container["Names"][0].lstrip('/') if container["Names"] else container["Id"][:12],
+                        "status": container["State"],
+                        "image": "none" if container["Image"].startswith("sha256:") else container["Image"]
+                    } for container in docker_client.api.containers()]
+                    _docker_apps_cache['expires_at'] = now + DOCKER_APPS_CACHE_TTL
+                apps = _docker_apps_cache['apps']
+            return jsonify(apps)
         else:
             return jsonify({"error": "Client Docker non disponible"}), 500
     except Exception as e:
@@ -430,19 +786,10 @@ def list_docker_apps():
 @app.route('/api/n8n/workflows', methods=['GET'])
 def list_n8n_workflows():
     """Liste les workflows n8n"""
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({"error": "Non autorisé"}), 401
-    
-    token = auth_header.split(' ')[1]
-    payload = verify_token(token)
-    if not payload:
-        return jsonify({"error": "Token invalide"}), 401
-    
     try:
-        headers = {'X-N8N-API-KEY': N8N_API_KEY}
-        response = requests.get(f"{N8N_API_URL}/api/v1/workflows", headers=headers)
-        return jsonify(response.json())
+        response = get_n8n_session().get(f"{N8N_API_URL}/api/v1/workflows", timeout=N8N_TIMEOUT)
+        # Relayer le JSON tel quel, sans le désérialiser puis le resérialiser
+        return app.response_class(response.content, mimetype='application/json')
     except Exception as e:
         logger.error(f"Erreur lors de la liste des workflows n8n: {str(e)}")
         return jsonify({"error": str(e)}), 500
@@ -454,29 +801,8 @@ def list_n8n_workflows():
 @app.route('/api/projects', methods=['GET'])
 def list_projects():
     """Liste tous les projets disponibles"""
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({"error": "Non autorisé"}), 401
-    
-    token = auth_header.split(' ')[1]
-    payload = verify_token(token)
-    if not payload:
-        return jsonify({"error": "Token invalide"}), 401
-    
     try:
-        projects = []
-        apps_dir = f"{DOCKER_PATH}/apps"
-        
-        # Scanner le dossier apps pour trouver les projets
-        if os.path.exists(apps_dir):
-            for project_name in os.listdir(apps_dir):
-                project_path = os.path.join(apps_dir, project_name)
-                if os.path.isdir(project_path):
-                    # Lire les métadonnées du projet
-                    project_info = get_project_info(project_name, project_path)
-                    projects.append(project_info)
-        
-        return jsonify(projects)
+        return jsonify(scan_projects())
     except Exception as e:
         logger.error(f"Erreur lors de la liste des projets: {str(e)}")
         return jsonify({"error": str(e)}), 500
@@ -484,15 +810,6 @@ def list_projects():
 @app.route('/api/projects', methods=['POST'])
 def create_project():
     """Crée un nouveau projet"""
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({"error": "Non autorisé"}), 401
-    
-    token = auth_header.split(' ')[1]
-    payload = verify_token(token)
-    if not payload:
-        return jsonify({"error": "Token invalide"}), 401
-    
     data = request.json
     project_name = data.get('name', '').strip()
     template = data.get('template', '').strip()
@@ -504,6 +821,7 @@ def create_project():
     try:
         # Créer le projet avec l'agent meta
         project_info = create_project_with_meta_agent(project_name, template, description)
+        invalidate_projects_cache()
         return jsonify(project_info), 201
     except Exception as e:
         logger.error(f"Erreur lors de la création du projet: {str(e)}")
@@ -512,15 +830,6 @@ def create_project():
 @app.route('/api/projects/<project_id>/session', methods=['POST'])
 def create_project_session(project_id):
     """Crée ou récupère une session tmux pour un projet spécifique"""
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({"error": "Non autorisé"}), 401
-    
-    token = auth_header.split(' ')[1]
-    payload = verify_token(token)
-    if not payload:
-        return jsonify({"error": "Token invalide"}), 401
-    
     try:
         # Vérifier que le projet existe
         project_path = f"{DOCKER_PATH}/apps/{project_id}"
@@ -538,15 +847,6 @@ def create_project_session(project_id):
 @app.route('/api/projects/<project_id>', methods=['DELETE'])
 def delete_project(project_id):
     """Supprime un projet"""
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({"error": "Non autorisé"}), 401
-    
-    token = auth_header.split(' ')[1]
-    payload = verify_token(token)
-    if not payload:
-        return jsonify({"error": "Token invalide"}), 401
-    
     try:
         project_path = f"{DOCKER_PATH}/apps/{project_id}"
         if not os.path.exists(project_path):
@@ -562,6 +862,7 @@ def delete_project(project_id):
         # import shutil
         # shutil.rmtree(project_path)
         
+        invalidate_projects_cache()
         return jsonify({"message": "Projet supprimé avec succès"})
     except Exception as e:
         logger.error(f"Erreur lors de la suppression du projet: {str(e)}")
@@ -571,61 +872,160 @@ def delete_project(project_id):
 # FONCTIONS UTILITAIRES PROJETS
 # ================================
 
+def scan_projects():
+    """Scanne le dossier apps (avec cache invalidé par le mtime du dossier)"""
+    apps_dir = f"{DOCKER_PATH}/apps"
+    
+    try:
+        mtime = os.stat(apps_dir).st_mtime_ns
+    except FileNotFoundError:
+        return []
+    
+    now = time.monotonic()
+    with _projects_cache_lock:
+        if _projects_cache.get('mtime') == mtime and now < _projects_cache.get('expires_at', 0):
+            return _projects_cache['projects']
+    
+    # os.scandir fournit le type d'entrée sans stat supplémentaire par projet
+    projects = []
+    with os.scandir(apps_dir) as entries:
+        for entry in entries:
+            # Les dossiers cachés (projets en cours de création) ne sont pas des projets
+            if entry.is_dir() and not entry.name.startswith('.'):
+                # Lire les métadonnées du projet
+                projects.append(get_project_info(entry.name, entry.path))
+    
+    with _projects_cache_lock:
+        _projects_cache.update(mtime=mtime, projects=projects, expires_at=now + PROJECTS_CACHE_TTL)
+    
+    return projects
+
+def invalidate_projects_cache():
+    """Invalide le cache de la liste des projets"""
+    with _projects_cache_lock:
+        _projects_cache.clear()
+    project_created_at.cache_clear()
+
+@functools.lru_cache(maxsize=1024)
+def project_created_at(project_path):
+    """Date de création d'un projet au format ISO (lue une seule fois par dossier)"""
+    return datetime.fromtimestamp(os.path.getctime(project_path)).isoformat()
+
+def list_entries(path):
+    """Liste les entrées d'un dossier en un seul os.scandir (nom -> DirEntry)"""
+    with os.scandir(path) as entries:
+        return {entry.name: entry for entry in entries}
+
+@functools.lru_cache(maxsize=512)
+def read_project_description(readme_file, mtime_ns, size):
+    """Extrait la description d'un README.md (mémoïsée par révision du fichier)"""
+    with open(readme_file, 'r', encoding='utf-8') as f:
+        # Seules les deux premières lignes sont utiles
+        first_line = f.readline()
+        second_line = f.readline()
+    if second_line:
+        return second_line.strip() if second_line.startswith('#') else first_line.strip()
+    return ""
+
+@functools.lru_cache(maxsize=256)
+def detect_frontend_template(package_json, mtime_ns, size):
+    """Détermine le template d'après les dépendances du package.json (mémoïsé par révision du fichier)"""
+    try:
+        with open(package_json, 'rb') as f:
+            package = json.load(f)
+        dependencies = {**package.get('devDependencies', {}), **package.get('dependencies', {})}
+    except (ValueError, AttributeError, TypeError):
+        return None
+    # Noms exacts: évite les faux positifs (preact, vuex-persist...)
+    if 'react' in dependencies:
+        return "react-node-postgres"
+    if 'vue' in dependencies:
+        return "vue-flask-postgres"
+    return None
+
+@functools.lru_cache(maxsize=1024)
+def project_urls(project_name):
+    """URLs d'un projet (construites une seule fois par nom, à ne pas modifier)"""
+    return {
+        "staging": STAGING_URL_TEMPLATE.format(project_name),
+        "production": PRODUCTION_URL_TEMPLATE.format(project_name),
+        "development": DEVELOPMENT_URL
+    }
+
+@functools.lru_cache(maxsize=1024)
+def read_project_metadata(metadata_file, mtime_ns, size):
+    """Lit les métadonnées écrites à la création du projet (mémoïsées par révision du fichier, à ne pas modifier)"""
+    try:
+        with open(metadata_file, 'rb') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"Métadonnées illisibles {metadata_file}: {str(e)}")
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+def write_project_metadata(project_path, template, description):
+    """Enregistre le template et la description d'un nouveau projet"""
+    metadata = {
+        "template": template,
+        "description": description,
+        "created_at": datetime.now().isoformat()
+    }
+    try:
+        # Document encodé d'un bloc puis écrit en une fois (json.dump écrirait fragment par fragment)
+        with open(os.path.join(project_path, PROJECT_METADATA_FILE), 'wb') as f:
+            f.write(json.dumps(metadata, indent=2).encode('utf-8'))
+    except OSError as e:
+        logger.error(f"Erreur lors de l'écriture des métadonnées du projet: {str(e)}")
+
+def detect_project_template(project_path, entries):
+    """Déduit le template d'un projet de sa structure (projets sans métadonnées)"""
+    template = "unknown"
+    
+    # Lire docker-compose.yml pour déterminer le template
+    if 'docker-compose.yml' in entries:
+        # Analyser le docker-compose pour déterminer le template
+        if 'frontend' in entries:
+            if 'backend' in entries:
+                # Check pour React/Vue (analyse refaite seulement si package.json a changé)
+                package_json = os.path.join(project_path, 'frontend', 'package.json')
+                try:
+                    package_stat = os.stat(package_json)
+                    template = detect_frontend_template(
+                        package_json, package_stat.st_mtime_ns, package_stat.st_size
+                    ) or template
+                except FileNotFoundError:
+                    pass
+            else:
+                template = "static-site"
+        else:
+            template = "api-backend"
+    return template
+
 def get_project_info(project_name, project_path):
     """Récupère les informations d'un projet"""
     try:
-        # Lire docker-compose.yml pour déterminer le template
-        compose_file = os.path.join(project_path, 'docker-compose.yml')
-        template = "unknown"
-        
-        if os.path.exists(compose_file):
-            # Analyser le docker-compose pour déterminer le template
-            if os.path.exists(os.path.join(project_path, 'frontend')):
-                if os.path.exists(os.path.join(project_path, 'backend')):
-                    # Check pour React/Vue
-                    package_json = os.path.join(project_path, 'frontend', 'package.json')
-                    if os.path.exists(package_json):
-                        with open(package_json, 'r') as f:
-                            content = f.read()
-                            if 'react' in content.lower():
-                                template = "react-node-postgres"
-                            elif 'vue' in content.lower():
-                                template = "vue-flask-postgres"
-                else:
-                    template = "static-site"
-            else:
-                template = "api-backend"
+        # Un seul parcours du dossier remplace les tests d'existence successifs
+        entries = list_entries(project_path)
         
-        # Lire README.md pour la description
-        readme_file = os.path.join(project_path, 'README.md')
-        description = ""
-        if os.path.exists(readme_file):
-            with open(readme_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                if len(lines) > 1:
-                    description = lines[1].strip() if lines[1].startswith('#') else lines[0].strip()
+        # Métadonnées écrites à la création: template et description sans analyser le dossier
+        metadata = {}
+        if PROJECT_METADATA_FILE in entries:
+            metadata_stat = entries[PROJECT_METADATA_FILE].stat()
+            metadata = read_project_metadata(
+                entries[PROJECT_METADATA_FILE].path, metadata_stat.st_mtime_ns, metadata_stat.st_size
+            )
+        template = metadata.get("template") or detect_project_template(project_path, entries)
         
-        # Déterminer le statut
-        status = "inactive"
-        if docker_client:
-            try:
-                containers = docker_client.containers.list(filters={"name": project_name})
-                if containers:
-                    status = "active"
-                else:
-                    # Vérifier les conteneurs arrêtés
-                    stopped_containers = docker_client.containers.list(all=True, filters={"name": project_name})
-                    if stopped_containers:
-                        status = "developing"
-            except:
-                pass
+        # Lire README.md pour la description (relue seulement si le fichier a changé)
+        description = metadata.get("description") or ""
+        if not description and 'README.md' in entries:
+            readme_stat = entries['README.md'].stat()
+            description = read_project_description(
+                entries['README.md'].path, readme_stat.st_mtime_ns, readme_stat.st_size
+            )
         
-        # URLs du projet
-        urls = {
-            "staging": f"https://{project_name}-staging.colaig.fr",
-            "production": f"https://{project_name}.colaig.fr",
-            "development": f"http://localhost:3000"  # Port par défaut
-        }
+        # Déterminer le statut (état des conteneurs tenu à jour par les événements Docker)
+        status = project_container_status(project_name)
         
         return {
             "id": project_name,
@@ -633,8 +1033,8 @@ def get_project_info(project_name, project_path):
             "description": description or f"Projet {project_name}",
             "template": template,
             "status": status,
-            "created_at": datetime.fromtimestamp(os.path.getctime(project_path)).isoformat(),
-            "urls": urls
+            "created_at": metadata.get("created_at") or project_created_at(project_path),
+            "urls": project_urls(project_name)
         }
     except Exception as e:
         logger.error(f"Erreur lors de la lecture des infos du projet {project_name}: {str(e)}")
@@ -644,49 +1044,89 @@ def get_project_info(project_name, project_path):
             "description": f"Projet {project_name}",
             "template": "unknown",
             "status": "inactive",
-            "created_at": datetime.now().isoformat(),
+            "created_at": STARTED_AT,
             "urls": {}
         }
 
+def project_environment(project_id, project_path):
+    """Variables d'environnement de la session Claude Code d'un projet (CLAUDE.md testé une seule fois)"""
+    environment = {
+        'PROJECT_NAME': project_id,
+        'PROJECT_PATH': project_path,
+    }
+    
+    # Configurer le contexte CLAUDE.md si disponible
+    claude_md_path = f"{project_path}/CLAUDE.md"
+    if os.path.exists(claude_md_path):
+        environment['CLAUDE_PROJECT_CONTEXT'] = claude_md_path
+        logger.info(f"Contexte CLAUDE.md configuré pour le projet {project_id}")
+    
+    return environment
+
+def is_claude_ready(output):
+    """Indique si la sortie d'un panneau montre l'interface Claude Code"""
+    return any(marker in output for marker in CLAUDE_READY_MARKERS)
+
+def wait_for_claude_ready(session_name, timeout=CLAUDE_READY_TIMEOUT):
+    """Attend l'interface Claude Code (intervalle croissant), abandonne si la session disparaît"""
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while True:
+        result = run_tmux("capture-pane", "-p", "-t", session_name)
+        if result.returncode != 0:
+            logger.warning(f"Session {session_name} fermée pendant le démarrage de Claude Code")
+            return False
+        if is_claude_ready(result.stdout):
+            return True
+        if time.monotonic() + delay > deadline:
+            logger.warning(f"Claude Code non prêt après {timeout}s dans la session {session_name}")
+            return False
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.5)
+
 def get_or_create_project_session(project_id):
     """Crée ou récupère une session tmux pour un projet"""
     session_name = f"claude_project_{project_id}"
     
+    # Session confirmée prête récemment: inutile de sonder tmux à nouveau
+    with _sessions_lock:
+        session_id = project_sessions.get(session_name)
+        ready_at = _project_ready_at.get(session_name)
+        if session_id is not None and ready_at is not None and time.monotonic() - ready_at < PROJECT_READY_TTL:
+            return session_id
+    
     try:
         # D'abord vérifier si la session tmux existe
-        result = subprocess.run(f"tmux has-session -t {session_name}", 
-                              shell=True, capture_output=True)
+        result = run_tmux("has-session", "-t", session_name)
         
         if result.returncode == 0:
             # Session tmux existe, vérifier si Claude Code fonctionne
-            output = subprocess.run(f"tmux capture-pane -p -t {session_name}", 
-                                  shell=True, capture_output=True, text=True)
+            output = run_tmux("capture-pane", "-p", "-t", session_name)
             
             # Si la session ne contient pas l'interface Claude Code, relancer
-            if "Try \"how do I log an error?\"" not in output.stdout and "cwd:" not in output.stdout:
+            ready = is_claude_ready(output.stdout)
+            if not ready:
                 logger.info(f"Session {session_name} trouvée mais Claude Code non actif, relancement...")
                 project_path = f"{DOCKER_PATH}/apps/{project_id}"
                 
-                # Configurer l'environnement et relancer Claude Code
-                subprocess.run(f"tmux send-keys -t {session_name} 'cd {project_path}' C-m", shell=True)
-                subprocess.run(f"tmux send-keys -t {session_name} 'export PROJECT_NAME={project_id}' C-m", shell=True)
-                subprocess.run(f"tmux send-keys -t {session_name} 'export PROJECT_PATH={project_path}' C-m", shell=True)
-                
-                claude_md_path = f"{project_path}/CLAUDE.md"
-                if os.path.exists(claude_md_path):
-                    subprocess.run(f"tmux send-keys -t {session_name} 'export CLAUDE_PROJECT_CONTEXT=\"{claude_md_path}\"' C-m", shell=True)
+                # Configurer l'environnement du shell existant et relancer Claude Code (un seul appel tmux)
+                environment = project_environment(project_id, project_path)
+                keys = [f"cd {project_path}"]
+                keys.extend(f'export {name}="{value}"' for name, value in environment.items())
                 
                 # Lancer Claude Code avec le chemin complet
-                subprocess.run(f"tmux send-keys -t {session_name} '/root/.npm-global/bin/claude' C-m", shell=True)
-                time.sleep(3)  # Attendre que Claude Code démarre
+                keys.append("/root/.npm-global/bin/claude")
+                run_tmux_batch(*[["send-keys", "-t", session_name, key, "C-m"] for key in keys])
+                ready = wait_for_claude_ready(session_name)
             
             # Récupérer ou créer l'ID de session
-            if session_name not in project_sessions:
-                session_id = str(uuid.uuid4())
-                project_sessions[session_name] = session_id
-                logger.info(f"Reconnexion à la session tmux {session_name}")
-            else:
-                session_id = project_sessions[session_name]
+            with _sessions_lock:
+                session_id = project_sessions.get(session_name)
+                if session_id is None:
+                    session_id = project_sessions[session_name] = str(uuid.uuid4())
+                    logger.info(f"Reconnexion à la session tmux {session_name}")
+                if ready:
+                    _project_ready_at[session_name] = time.monotonic()
             return session_id
         else:
             # Créer une nouvelle session tmux pour ce projet
@@ -694,31 +1134,23 @@ def get_or_create_project_session(project_id):
             
             logger.info(f"Création de la session tmux pour le projet {project_id}")
             
-            # Créer la session en arrière-plan
-            subprocess.run(f"tmux new-session -d -s {session_name}", shell=True)
-            
-            # Configurer l'environnement pour Claude Code
-            subprocess.run(f"tmux send-keys -t {session_name} 'cd {project_path}' C-m", shell=True)
-            subprocess.run(f"tmux send-keys -t {session_name} 'export PROJECT_NAME={project_id}' C-m", shell=True)
-            subprocess.run(f"tmux send-keys -t {session_name} 'export PROJECT_PATH={project_path}' C-m", shell=True)
+            # Environnement et dossier passés directement à tmux (-e, -c): aucune frappe dans un shell
+            environment = project_environment(project_id, project_path)
+            args = ["new-session", "-d", "-s", session_name, "-c", project_path]
+            for name, value in environment.items():
+                args.extend(["-e", f"{name}={value}"])
             
-            # Configurer le contexte CLAUDE.md si disponible
-            claude_md_path = f"{project_path}/CLAUDE.md"
-            if os.path.exists(claude_md_path):
-                subprocess.run(f"tmux send-keys -t {session_name} 'export CLAUDE_PROJECT_CONTEXT=\"{claude_md_path}\"' C-m", shell=True)
-                logger.info(f"Contexte CLAUDE.md configuré pour le projet {project_id}")
-            
-            # Démarrer Claude Code silencieusement
-            subprocess.run(f"tmux send-keys -t {session_name} 'clear' C-m", shell=True)
-            subprocess.run(f"tmux send-keys -t {session_name} '/root/.npm-global/bin/claude' C-m", shell=True)
+            # Démarrer Claude Code directement; un shell prend le relais s'il se termine
+            run_tmux(*args, "/root/.npm-global/bin/claude; exec bash")
             
             # Attendre que Claude Code soit prêt
-            time.sleep(3)
-            
-            time.sleep(2)
+            ready = wait_for_claude_ready(session_name)
             
         session_id = str(uuid.uuid4())
-        project_sessions[session_name] = session_id
+        with _sessions_lock:
+            project_sessions[session_name] = session_id
+            if ready:
+                _project_ready_at[session_name] = time.monotonic()
         
         logger.info(f"Session {session_id} créée pour le projet {project_id}")
         return session_id
@@ -731,9 +1163,11 @@ def cleanup_project_session(project_id):
     """Nettoie la session tmux d'un projet"""
     session_name = f"claude_project_{project_id}"
     try:
-        subprocess.run(f"tmux kill-session -t {session_name} 2>/dev/null || true", shell=True)
-        if session_name in project_sessions:
-            del project_sessions[session_name]
+        run_tmux("kill-session", "-t", session_name)
+        stop_project_monitor(session_name)
+        with _sessions_lock:
+            project_sessions.pop(session_name, None)
+            _project_ready_at.pop(session_name, None)
         logger.info(f"Session du projet {project_id} nettoyée")
     except Exception as e:
         logger.error(f"Erreur lors du nettoyage de la session {project_id}: {str(e)}")
@@ -744,9 +1178,31 @@ def stop_project_services(project_id):
         project_path = f"{DOCKER_PATH}/apps/{project_id}"
         compose_file = os.path.join(project_path, 'docker-compose.yml')
         
-        if os.path.exists(compose_file):
-            subprocess.run(f"cd {project_path} && docker-compose down", shell=True)
-            logger.info(f"Services Docker du projet {project_id} arrêtés")
+        if not os.path.exists(compose_file):
+            return
+        
+        docker_client = get_docker_client()
+        if not docker_client:
+            logger.warning(f"Client Docker non disponible, services du projet {project_id} non arrêtés")
+            return
+        
+        # Équivalent de `docker-compose down` via l'API: conteneurs puis réseaux portant
+        # le label du projet compose (nom du dossier normalisé, compose v2 puis v1)
+        compose_projects = {
+            re.sub(r'[^a-z0-9_-]', '', project_id.lower()),
+            re.sub(r'[^a-z0-9]', '', project_id.lower())
+        }
+        removed = 0
+        for compose_project in compose_projects:
+            label = f"com.docker.compose.project={compose_project}"
+            for container in docker_client.api.containers(all=True, filters={'label': label}):
+                docker_client.api.stop(container['Id'])
+                docker_client.api.remove_container(container['Id'])
+                removed += 1
+            for network in docker_client.api.networks(filters={'label': label}):
+                docker_client.api.remove_network(network['Id'])
+        
+        logger.info(f"Services Docker du projet {project_id} arrêtés ({removed} conteneur(s) supprimé(s))")
     except Exception as e:
         logger.error(f"Erreur lors de l'arrêt des services du projet {project_id}: {str(e)}")
 
@@ -766,6 +1222,7 @@ def create_project_with_meta_agent(project_name, template, description):
         
         # Retourner les informations du projet créé
         project_path = result["path"]
+        write_project_metadata(project_path, template, description)
         return get_project_info(project_name, project_path)
         
     except Exception as e:
@@ -795,7 +1252,8 @@ def handle_join(data):
         try:
             # Si la session n'existe pas, on la crée
             create_tmux_session(session_id)
-            active_sessions[session_id] = user_id
+            with _sessions_lock:
+                active_sessions[session_id] = user_id
         except Exception as e:
             logger.error(f"Erreur lors de la création de la session {session_id}: {str(e)}")
             emit('error', {'message': f'Erreur lors de la création de la session: {str(e)}'})
@@ -805,8 +1263,14 @@ def handle_join(data):
     output = get_tmux_output(session_id)
     logger.info(f"Utilisateur {username} a rejoint la session {session_id}")
     
-    # Rejoindre la room avec l'ID du client
-    join_room(request.sid)
+    # Rejoindre la room de la session (diffusion unique pour tous les clients)
+    join_room(session_id)
+    with _sessions_lock:
+        _output_resync.add(session_id)
+        # Réveiller le moniteur sans attendre une nouvelle sortie tmux ni le délai d'inactivité
+        wakeup = _output_wakeups.get(session_id)
+    if wakeup is not None:
+        wakeup.set()
     
     # Envoyer la sortie initiale
     emit('joined', {
@@ -814,14 +1278,8 @@ def handle_join(data):
         'initial_output': output
     })
     
-    # Démarrer un thread pour surveiller la sortie
-    if session_id not in output_threads:
-        output_threads[session_id] = threading.Thread(
-            target=monitor_tmux_output,
-            args=(session_id, request.sid),
-            daemon=True
-        )
-        output_threads[session_id].start()
+    # Démarrer un thread pour surveiller la sortie (un seul par session)
+    start_output_monitor(session_id, monitor_tmux_output, session_id)
 
 @socketio.on('message')
 def handle_message(data):
@@ -891,14 +1349,8 @@ def handle_join_project(data):
             'initial_output': initial_output
         })
         
-        # Démarrer le monitoring de la session projet
-        if session_name not in output_threads:
-            output_threads[session_name] = threading.Thread(
-                target=monitor_project_tmux_output,
-                args=(session_name, project_id, request.sid),
-                daemon=True
-            )
-            output_threads[session_name].start()
+        # Ajouter la session projet à la surveillance partagée (une seule fois par session)
+        start_project_monitor(session_name, project_id)
             
     except Exception as e:
         logger.error(f"Erreur lors de la connexion au projet {project_id}: {str(e)}")
@@ -931,24 +1383,21 @@ def handle_project_message(data):
         
         logger.info(f"Message de {username} pour projet {project_id}: {message}")
         send_to_project_tmux(session_name, message)
-        
-        # Récupérer immédiatement la sortie mise à jour et l'envoyer
-        new_output = get_project_tmux_output(session_name)
-        if new_output:
-            # Envoyer au room du projet
-            emit('output', {'output': new_output}, room=f"project_{project_id}")
-            logger.info(f"Sortie mise à jour envoyée pour le projet {project_id}")
+        # La sortie sera envoyée à la room du projet par la boucle de surveillance
     except Exception as e:
         logger.error(f"Erreur lors de l'envoi du message au projet: {str(e)}")
         emit('error', {'message': f'Erreur lors de l\'envoi du message: {str(e)}'})
 
-def get_project_tmux_output(session_name):
-    """Récupère la sortie de la session tmux d'un projet"""
+def get_project_tmux_output(session_name, capture_state=None):
+    """Récupère la sortie de la session tmux d'un projet
+    
+    Avec un état de capture (moniteur), seules les lignes d'historique ajoutées sont relues.
+    """
     try:
-        cmd = f"tmux capture-pane -p -S -1000 -t {session_name}"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        
-        output = result.stdout
+        if capture_state is None:
+            output = run_tmux("capture-pane", "-p", "-S", f"-{CAPTURE_HISTORY_LINES}", "-t", session_name).stdout
+        else:
+            output = capture_tmux_pane(session_name, capture_state)
         
         # Si pas de contenu, créer un message d'accueil
         if len(output.strip()) < 10:
@@ -960,15 +1409,31 @@ def get_project_tmux_output(session_name):
         logger.error(f"Erreur lors de la récupération de la sortie du projet: {str(e)}")
         return f"Erreur de connexion au terminal du projet.\nDétails: {str(e)}"
 
+def literal_key_commands(target, text):
+    """Commandes send-keys reproduisant `text` à l'identique
+    
+    Les retours à la ligne deviennent des touches (C-j, C-m) pour que chaque argument
+    tienne sur une ligne et passe par le canal de commandes plutôt que par un fork.
+    """
+    commands = []
+    for part in re.split(r'(\r|\n)', text):
+        if part == '\n':
+            commands.append(["send-keys", "-t", target, "C-j"])
+        elif part == '\r':
+            commands.append(["send-keys", "-t", target, "C-m"])
+        elif part:
+            commands.append(["send-keys", "-t", target, "-l", "--", part])
+    return commands
+
 def send_to_project_tmux(session_name, command):
     """Envoie une commande à la session Claude Code dédiée du projet"""
     try:
-        # Échapper les caractères spéciaux
-        escaped_command = command.replace("'", "'\\''")
-        
-        # Envoyer le message avec C-m inclus dans le message puis C-m pour l'exécuter
-        cmd = f"tmux send-keys -t {session_name} '{escaped_command} C-m' C-m"
-        subprocess.run(cmd, shell=True)
+        # Texte envoyé tel quel (-l: pas d'interprétation des noms de touches, aucun shell),
+        # puis une vraie touche Entrée, en un seul appel tmux
+        run_tmux_batch(
+            *literal_key_commands(session_name, command),
+            ["send-keys", "-t", session_name, "C-m"]
+        )
         
         logger.info(f"Message envoyé à Claude Code {session_name}: {command}")
         
@@ -976,43 +1441,151 @@ def send_to_project_tmux(session_name, command):
         logger.error(f"Erreur lors de l'envoi du message à Claude Code: {str(e)}")
         raise
 
-def monitor_project_tmux_output(session_name, project_id, client_id):
-    """Surveille la sortie d'une session tmux de projet et envoie les mises à jour"""
+def start_project_monitor(session_name, project_id):
+    """Ajoute une session projet à la boucle de surveillance partagée (une seule fois par session)"""
+    global _project_monitor_thread
+    with _project_monitors_lock:
+        if session_name in _project_monitors:
+            return False
+        
+        if len(_project_monitors) >= MAX_OUTPUT_MONITORS:
+            logger.warning(f"Nombre maximal de moniteurs atteint ({MAX_OUTPUT_MONITORS}), surveillance de {session_name} refusée")
+            return False
+        
+        control = start_tmux_control_client(session_name)
+        _project_monitors[session_name] = {
+            'control': control,
+            'project_id': project_id,
+            'buffer': b'',
+            'previous_output': "",
+            'capture_state': {},
+            # Première capture dès que le client est attaché
+            'due': time.monotonic() + CONTROL_MODE_COALESCE_DELAY
+        }
+        _project_selector.register(control.stdout.fileno(), selectors.EVENT_READ, session_name)
+        
+        if _project_monitor_thread is None or not _project_monitor_thread.is_alive():
+            _project_monitor_thread = threading.Thread(
+                target=run_project_monitors,
+                name="project-monitors",
+                daemon=True
+            )
+            _project_monitor_thread.start()
+    
     logger.info(f"Démarrage de la surveillance pour le projet {project_id}, session {session_name}")
+    # Réveiller la boucle pour qu'elle prenne en compte la nouvelle échéance
+    os.write(_project_wakeup_write, b'.')
+    return True
+
+def stop_project_monitor(session_name):
+    """Retire une session projet de la boucle de surveillance et ferme son client"""
+    with _project_monitors_lock:
+        monitor = _project_monitors.pop(session_name, None)
+    if monitor is None:
+        return
+    
+    control = monitor['control']
+    try:
+        _project_selector.unregister(control.stdout.fileno())
+    except (KeyError, ValueError):
+        pass
+    if control.poll() is None:
+        control.terminate()
+    try:
+        control.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        control.kill()
+    control.stdout.close()
     
-    previous_output = ""
+    logger.info(f"Arrêt de la surveillance pour le projet {monitor['project_id']}")
+
+def run_project_monitors():
+    """Boucle unique de surveillance de toutes les sessions projet
     
+    Les notifications %output de chaque client en mode contrôle planifient une capture
+    (regroupée sur CONTROL_MODE_COALESCE_DELAY); aucune activité, aucun réveil.
+    """
     while True:
         try:
-            # Vérifier si la session tmux existe encore
-            result = subprocess.run(f"tmux has-session -t {session_name}", 
-                                  shell=True, capture_output=True)
+            with _project_monitors_lock:
+                deadlines = [monitor['due'] for monitor in _project_monitors.values() if monitor['due'] is not None]
+            timeout = max(min(deadlines) - time.monotonic(), 0) if deadlines else None
             
-            if result.returncode != 0:
-                logger.info(f"Session tmux {session_name} fermée, arrêt de la surveillance")
-                break
+            for key, _ in _project_selector.select(timeout):
+                if key.data is None:
+                    os.read(_project_wakeup_read, 4096)
+                else:
+                    read_project_control_client(key.data, key.fd)
             
+            capture_due_project_sessions()
+        except Exception as e:
+            logger.error(f"Erreur dans la boucle de surveillance des projets: {str(e)}")
+            time.sleep(1)
+
+def read_project_control_client(session_name, fd):
+    """Lit les notifications d'un client en mode contrôle et planifie une capture"""
+    with _project_monitors_lock:
+        if session_name not in _project_monitors:
+            return
+    
+    try:
+        chunk = os.read(fd, 65536)
+    except (BlockingIOError, InterruptedError):
+        # Réveil sans données (tube non bloquant sous gevent): le client est toujours là
+        return
+    except OSError as e:
+        logger.error(f"Erreur de lecture du mode contrôle pour {session_name}: {str(e)}")
+        chunk = b''
+    
+    with _project_monitors_lock:
+        monitor = _project_monitors.get(session_name)
+        if monitor is None:
+            return
+        lines = (monitor['buffer'] + chunk).split(b'\n')
+        monitor['buffer'] = lines.pop()
+        # Fermé uniquement sur fin de flux (lecture vide), erreur réelle ou %exit
+        closed = not chunk
+        for line in lines:
+            if line.startswith(b'%output'):
+                if monitor['due'] is None:
+                    monitor['due'] = time.monotonic() + CONTROL_MODE_COALESCE_DELAY
+            elif line.startswith(b'%exit'):
+                closed = True
+    
+    if closed:
+        logger.info(f"Session tmux {session_name} fermée, arrêt de la surveillance")
+        stop_project_monitor(session_name)
+        # Session tuée hors de l'application: oublier son identifiant
+        with _sessions_lock:
+            project_sessions.pop(session_name, None)
+            _project_ready_at.pop(session_name, None)
+
+def capture_due_project_sessions():
+    """Capture et diffuse la sortie des sessions projet dont l'échéance est atteinte"""
+    now = time.monotonic()
+    with _project_monitors_lock:
+        due = [(session_name, monitor) for session_name, monitor in _project_monitors.items()
+               if monitor['due'] is not None and monitor['due'] <= now]
+        for _, monitor in due:
+            monitor['due'] = None
+    
+    for session_name, monitor in due:
+        project_id = monitor['project_id']
+        try:
             # Récupérer la sortie actuelle
-            current_output = get_project_tmux_output(session_name)
+            current_output = get_project_tmux_output(session_name, monitor['capture_state'])
             
             # Si la sortie a changé, l'envoyer au client
-            if current_output != previous_output:
+            if current_output != monitor['previous_output']:
                 socketio.emit('output', {
                     'output': current_output,
                     'project_id': project_id,
                     'session_name': session_name
                 }, room=f"project_{project_id}")
                 
-                previous_output = current_output
-            
-            # Attendre avant la prochaine vérification
-            time.sleep(0.5)
-            
+                monitor['previous_output'] = current_output
         except Exception as e:
             logger.error(f"Erreur lors de la surveillance du projet {project_id}: {str(e)}")
-            time.sleep(1)
-    
-    logger.info(f"Arrêt de la surveillance pour le projet {project_id}")
 
 @socketio.on('disconnect')
 def handle_disconnect():
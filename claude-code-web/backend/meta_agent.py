@@ -16,159 +16,1163 @@ Fonctionnalités :
 """
 
 import os
+import re
+import errno
 import json
 import shutil
+import functools
 import subprocess
+import time
 import logging
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import fcntl
+except ImportError:  # Systèmes sans ioctl (Windows)
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# Nom de projet: sert de nom de conteneur et de sous-domaine (label DNS ASCII de 63 caractères au plus)
+PROJECT_NAME_PATTERN = re.compile(r"\A[A-Za-z0-9][A-Za-z0-9_-]{0,62}\Z")
+
+# Dossiers créés dans tout nouveau projet
+BASE_FOLDERS = ("frontend", "backend", "database", "tests", "docs")
+
+# Codes couleur partagés par les scripts générés (scripts/*.sh)
+SCRIPT_COLORS = """GREEN='\\033[0;32m'
+BLUE='\\033[0;34m'
+YELLOW='\\033[1;33m'
+RED='\\033[0;31m'
+NC='\\033[0m'"""
+
+# Sections de CLAUDE.md identiques pour tous les projets
+CLAUDE_MD_COMMANDS = """
+
+## Development Commands
+
+### Quick Start
+```bash
+# Copy environment variables
+cp .env.example .env
+
+# Edit configuration
+nano .env
+
+# Start all services
+COMPOSE_DOCKER_CLI_BUILD=1 DOCKER_BUILDKIT=1 docker-compose up -d --build
+
+# View logs
+docker-compose logs -f
+```
+
+### Development Workflow
+```bash
+# Development mode
+./scripts/start.sh
+
+# Build for production  
+./scripts/build.sh
+
+# Run tests
+./scripts/test.sh
+
+# Deploy to staging
+./scripts/deploy.sh staging
+```
+
+### Container Management
+```bash
+# Stop all services
+docker-compose down
+
+# Restart specific service
+docker-compose restart frontend
+
+# Rebuild and restart
+COMPOSE_DOCKER_CLI_BUILD=1 DOCKER_BUILDKIT=1 docker-compose up -d --build frontend
+
+# View service logs
+docker-compose logs -f frontend
+```
+
+"""
+
+CLAUDE_MD_FOOTER = """
+
+## Code Conventions
+
+### Naming
+- Files: kebab-case (my-component.js)
+- Variables: camelCase (myVariable)
+- Constants: UPPER_SNAKE_CASE (API_URL)
+- Components: PascalCase (MyComponent)
+
+### Git Workflow
+- Main branch: `main`
+- Feature branches: `feature/feature-name`
+- Commit format: `type: description` (feat: add user authentication)
+
+## Deployment
+
+### Docker & Traefik
+All services are automatically configured with:
+- SSL certificates via Let's Encrypt
+- Reverse proxy routing
+- Health checks
+- Auto-restart policies
+
+### Environment Variables
+Required variables are documented in `.env.example`. Never commit actual `.env` files.
+
+### Database
+Database migrations and seeds are in the `database/` directory.
+
+## Security Considerations
+
+- All secrets in environment variables
+- HTTPS only in production
+- CORS configured for specific origins
+- Database access restricted to backend services
+- Regular security updates via Docker images
+
+---
+
+"""
+
+def script_header(kind, project_name, template_id):
+    """En-tête commun des scripts générés (shebang, set -e, couleurs)"""
+    return f"""#!/bin/bash
+# Script de {kind} pour {project_name}
+# Template: {template_id}
+
+set -e
+
+{SCRIPT_COLORS}"""
+
+def write_text(path, content, mode=None):
+    """Écrit un fichier texte UTF-8 directement sur le descripteur (sans tampon ni flush Python)"""
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666 if mode is None else mode)
+    try:
+        if mode is not None:
+            # Mode exact, indépendant de l'umask et appliqué aussi à un fichier existant
+            os.fchmod(fd, mode)
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def make_dirs(base, *names):
+    """Crée des sous-dossiers de base dans l'ordre donné (parents d'abord) avec un simple mkdir, sans remonter le chemin comme makedirs"""
+    for name in names:
+        try:
+            os.mkdir(os.path.join(base, name))
+        except FileExistsError:
+            pass
+
+FICLONE = 0x40049409  # ioctl Linux de clonage de fichier (reflink: Btrfs, XFS...)
+# Erreurs indiquant que le reflink n'est pas disponible (ext4, overlayfs, autre système de fichiers...)
+FICLONE_UNSUPPORTED_ERRNOS = frozenset((errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY))
+
+# Passe à False au premier refus du noyau: les fichiers suivants vont directement au repli
+_reflink_supported = fcntl is not None
+
+def clone_file(src, dst):
+    """Copie un fichier en partageant ses blocs (reflink) si le système de fichiers le permet"""
+    global _reflink_supported
+    if _reflink_supported:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError as e:
+            if e.errno in FICLONE_UNSUPPORTED_ERRNOS:
+                _reflink_supported = False
+        else:
+            shutil.copystat(src, dst)
+            return dst
+    # Repli: shutil.copy2 copie déjà dans le noyau (os.sendfile) sous Linux
+    return shutil.copy2(src, dst)
+
+# Section CLAUDE.md de conseils propres à chaque template (indépendante du projet)
+TEMPLATE_GUIDANCE = {
+    "react-node-postgres": """
+
+## React + Node.js Specific Guidance
+
+### Frontend Development
+```bash
+# Start React development server
+cd frontend && npm start
+
+# Build for production
+cd frontend && npm run build
+
+# Run frontend tests
+cd frontend && npm test
+```
+
+### Backend Development  
+```bash
+# Start Node.js API server
+cd backend && npm run dev
+
+# Run database migrations
+cd backend && npm run migrate
+
+# Seed database with sample data
+cd backend && npm run seed
+```
+
+### Common Patterns
+- Use React hooks for component logic
+- Implement proper error boundaries
+- Use React Query for API state management
+- Follow REST API conventions in backend
+- Implement proper authentication flows
+
+### Database Operations
+```bash
+# Create new migration
+cd backend && npm run migration:create add_users_table
+
+# Run migrations
+cd backend && npm run migrate
+
+# Rollback last migration  
+cd backend && npm run migrate:rollback
+```""",
+    "vue-flask-postgres": """
+
+## Vue.js + Flask Specific Guidance
+
+### Frontend Development
+```bash
+# Start Vue development server
+cd frontend && npm run serve
+
+# Build for production
+cd frontend && npm run build
+
+# Run frontend tests
+cd frontend && npm run test:unit
+```
+
+### Backend Development
+```bash
+# Start Flask development server
+cd backend && python app.py
+
+# Run database migrations
+cd backend && flask db upgrade
+
+# Create new migration
+cd backend && flask db migrate -m "description"
+```
+
+### Common Patterns
+- Use Vue 3 Composition API for better code organization
+- Implement Pinia stores for state management
+- Use Flask Blueprints for API organization
+- Implement proper CORS configuration
+- Use SQLAlchemy relationships effectively
+
+### Database Operations
+```bash
+# Initialize database
+cd backend && flask db init
+
+# Create migration
+cd backend && flask db migrate -m "Add user table"
+
+# Apply migrations
+cd backend && flask db upgrade
+```""",
+    "static-site": """
+
+## Static Site Specific Guidance
+
+### Development
+```bash
+# Serve locally for development
+cd frontend && python -m http.server 8000
+
+# Or use live-server for auto-reload
+npx live-server frontend/
+```
+
+### Build Process
+```bash
+# Optimize images
+cd frontend && npm run optimize:images
+
+# Minify CSS and JS
+cd frontend && npm run build
+
+# Deploy to production
+./scripts/deploy.sh production
+```
+
+### Performance Optimization
+- Optimize images and use modern formats (WebP, AVIF)
+- Implement lazy loading for images
+- Minify CSS and JavaScript
+- Use CDN for assets
+- Implement proper caching headers
+
+### SEO Best Practices
+- Use semantic HTML structure
+- Implement proper meta tags
+- Add structured data markup
+- Optimize for Core Web Vitals
+- Create XML sitemap""",
+    "api-backend": """
+
+## API Backend Specific Guidance
+
+### API Development
+```bash
+# Start API server in development
+cd backend && npm run dev
+
+# Generate API documentation
+cd backend && npm run docs:generate
+
+# Run API tests
+cd backend && npm test
+```
+
+### Database Operations
+```bash
+# Run migrations
+cd backend && npm run migrate
+
+# Seed database
+cd backend && npm run seed
+
+# Create new migration
+cd backend && npm run migration:create
+```
+
+### API Best Practices
+- Follow RESTful conventions
+- Implement proper HTTP status codes
+- Use consistent error response format
+- Implement rate limiting
+- Add request/response logging
+- Use API versioning
+
+### Security
+- Implement JWT authentication
+- Use HTTPS in production
+- Validate all inputs
+- Implement rate limiting
+- Add CORS configuration
+- Use security headers
+
+### Testing Strategy
+```bash
+# Unit tests
+npm run test:unit
+
+# Integration tests  
+npm run test:integration
+
+# End-to-end tests
+npm run test:e2e
+
+# Test coverage
+npm run test:coverage
+```"""
+}
+
+# Prochaines étapes renvoyées après la création d'un projet
+BASE_NEXT_STEPS = (
+    "Modifier le fichier .env selon vos besoins",
+    "Démarrer les services : ./scripts/build.sh puis docker-compose up -d",
+    "Tester l'application en local",
+    "Personnaliser le code selon vos besoins"
+)
+
+FULLSTACK_NEXT_STEPS = (
+    "Configurer la base de données",
+    "Implémenter les APIs",
+    "Ajouter les tests"
+)
+
+# URLs renvoyées après la création d'un projet ({project_name} remplacé par le nom du projet)
+PROJECT_URLS = {
+    "development": "http://localhost:3000",
+    "staging": "https://{project_name}-staging.colaig.fr",
+    "production": "https://{project_name}.colaig.fr",
+    "api_development": "http://localhost:5000",
+    "api_staging": "https://{project_name}-api-staging.colaig.fr",
+    "api_production": "https://{project_name}-api.colaig.fr"
+}
+
+# En-tête et fin communs de docker-compose.yml
+COMPOSE_HEADER = """version: '3.8'
+
+services:"""
+
+COMPOSE_FOOTER = """
+
+networks:
+  proxy:
+    external: true
+  internal:
+    driver: bridge
+
+volumes:
+  postgres_data:
+"""
+
+# Commandes de build.sh par template
+BUILD_COMMANDS = {
+    "react-node-postgres": """
+# Build frontend React
+echo -e "${BLUE}🎨 Build du frontend React...${NC}"
+cd frontend
+npm install
+npm run build
+cd ..
+
+# Build backend Node.js  
+echo -e "${BLUE}🔧 Build du backend Node.js...${NC}"
+cd backend
+npm install
+# Pas de build spécifique pour Node.js en général
+cd ..
+
+# Build des images Docker (frontend et backend en parallèle avec BuildKit;
+# si les deux images partageaient de lourdes couches de base, un build séquentiel peut être plus rapide)
+echo -e "${BLUE}🐳 Build des images Docker...${NC}"
+COMPOSE_DOCKER_CLI_BUILD=1 DOCKER_BUILDKIT=1 docker-compose build --parallel
+""",
+    "vue-flask-postgres": """
+# Build frontend Vue.js
+echo -e "${BLUE}🎨 Build du frontend Vue.js...${NC}"
+cd frontend
+npm install
+npm run build
+cd ..
+
+# Préparer backend Flask
+echo -e "${BLUE}🐍 Préparation du backend Flask...${NC}"
+cd backend
+if [ ! -d venv ]; then
+    python3 -m venv venv
+fi
+source venv/bin/activate
+pip install -r requirements.txt
+cd ..
+
+# Build des images Docker (frontend et backend en parallèle avec BuildKit;
+# si les deux images partageaient de lourdes couches de base, un build séquentiel peut être plus rapide)
+echo -e "${BLUE}🐳 Build des images Docker...${NC}"
+COMPOSE_DOCKER_CLI_BUILD=1 DOCKER_BUILDKIT=1 docker-compose build --parallel
+""",
+    "static-site": """
+# Optimisation du site statique
+echo -e "${BLUE}🌐 Optimisation du site statique...${NC}"
+cd frontend
+
+# Minification CSS/JS (si outils disponibles), un fichier par cœur en parallèle
+if command -v uglifyjs &> /dev/null; then
+    echo -e "${YELLOW}📦 Minification JavaScript...${NC}"
+    find . -name "*.js" -not -path "./node_modules/*" -print0 | xargs -0 -r -P "$(nproc)" -I{} uglifyjs {} -o {}
+fi
+
+if command -v cleancss &> /dev/null; then
+    echo -e "${YELLOW}📦 Minification CSS...${NC}"
+    find . -name "*.css" -not -path "./node_modules/*" -print0 | xargs -0 -r -P "$(nproc)" -I{} cleancss {} -o {}
+fi
+
+cd ..
+
+# Build de l'image Docker (un seul service construit: rien à paralléliser)
+echo -e "${BLUE}🐳 Build de l'image Docker...${NC}"
+COMPOSE_DOCKER_CLI_BUILD=1 DOCKER_BUILDKIT=1 docker-compose build
+""",
+    "api-backend": """
+# Build backend API
+echo -e "${BLUE}🔌 Build du backend API...${NC}"
+cd backend
+npm install
+# Tests de l'API
+npm test
+cd ..
+
+# Build de l'image Docker (un seul service construit: rien à paralléliser)
+echo -e "${BLUE}🐳 Build de l'image Docker...${NC}"
+COMPOSE_DOCKER_CLI_BUILD=1 DOCKER_BUILDKIT=1 docker-compose build
+"""
+}
+
+# Commandes de test.sh par template (les deux stacks complètes partagent les mêmes)
+FULLSTACK_TEST_COMMANDS = """
+# Tests frontend
+if [ -d "frontend" ]; then
+    echo -e "${BLUE}🎨 Tests frontend...${NC}"
+    cd frontend
+    npm test -- --watchAll=false
+    cd ..
+fi
+
+# Tests backend
+if [ -d "backend" ]; then
+    echo -e "${BLUE}🔧 Tests backend...${NC}"
+    cd backend
+    npm test || python -m pytest
+    cd ..
+fi
+
+# Tests d'intégration avec Docker
+echo -e "${BLUE}🐳 Tests d'intégration...${NC}"
+COMPOSE_DOCKER_CLI_BUILD=1 DOCKER_BUILDKIT=1 docker-compose -f docker-compose.test.yml up --build --abort-on-container-exit
+docker-compose -f docker-compose.test.yml down
+"""
+
+TEST_COMMANDS = {
+    "react-node-postgres": FULLSTACK_TEST_COMMANDS,
+    "vue-flask-postgres": FULLSTACK_TEST_COMMANDS,
+    "static-site": """
+# Validation HTML
+if command -v html5validator &> /dev/null; then
+    echo -e "${BLUE}📝 Validation HTML...${NC}"
+    html5validator --root frontend/
+fi
+
+# Tests de liens brisés
+if command -v linkchecker &> /dev/null; then
+    echo -e "${BLUE}🔗 Vérification des liens...${NC}"
+    linkchecker frontend/index.html
+fi
+
+# Tests de performance
+echo -e "${BLUE}⚡ Tests de performance basiques...${NC}"
+cd frontend
+python3 -m http.server 8000 &
+SERVER_PID=$!
+sleep 2
+curl -s -o /dev/null -w "Status: %{http_code}, Time: %{time_total}s" http://localhost:8000
+kill $SERVER_PID
+cd ..
+""",
+    "api-backend": """
+# Tests API backend
+echo -e "${BLUE}🔌 Tests API backend...${NC}"
+cd backend
+npm test
+cd ..
+
+# Tests d'intégration API
+echo -e "${BLUE}🧪 Tests d'intégration API...${NC}"
+docker-compose up -d database
+sleep 5
+cd backend
+npm run test:integration || python -m pytest tests/integration/
+cd ..
+docker-compose stop database
+"""
+}
+
+# Feuille de style et script du template site statique (identiques pour tous les projets)
+STATIC_SITE_CSS = """/* Reset et base */
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Inter', sans-serif;
+    line-height: 1.6;
+    color: #333;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 0 20px;
+}
+
+/* Header */
+.header {
+    background: #fff;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    position: fixed;
+    width: 100%;
+    top: 0;
+    z-index: 1000;
+}
+
+.nav {
+    padding: 1rem 0;
+}
+
+.nav .container {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+.nav-brand h1 {
+    color: #2563eb;
+    font-size: 1.5rem;
+    font-weight: 600;
+}
+
+.nav-menu {
+    display: flex;
+    list-style: none;
+    gap: 2rem;
+}
+
+.nav-menu a {
+    text-decoration: none;
+    color: #333;
+    font-weight: 500;
+    transition: color 0.3s;
+}
+
+.nav-menu a:hover {
+    color: #2563eb;
+}
+
+/* Sections */
+section {
+    padding: 80px 0;
+}
+
+.hero {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    text-align: center;
+    margin-top: 70px;
+}
+
+.hero h2 {
+    font-size: 3rem;
+    margin-bottom: 1rem;
+    font-weight: 600;
+}
+
+.hero p {
+    font-size: 1.2rem;
+    margin-bottom: 2rem;
+    opacity: 0.9;
+}
+
+/* Boutons */
+.btn {
+    display: inline-block;
+    padding: 12px 24px;
+    border: none;
+    border-radius: 6px;
+    font-weight: 500;
+    text-decoration: none;
+    cursor: pointer;
+    transition: all 0.3s;
+}
+
+.btn-primary {
+    background: #2563eb;
+    color: white;
+}
+
+.btn-primary:hover {
+    background: #1d4ed8;
+    transform: translateY(-2px);
+}
+
+/* About */
+.about {
+    background: #f8fafc;
+}
+
+.about h2 {
+    text-align: center;
+    margin-bottom: 2rem;
+    font-size: 2.5rem;
+    color: #1e293b;
+}
+
+/* Contact */
+.contact h2 {
+    text-align: center;
+    margin-bottom: 2rem;
+    font-size: 2.5rem;
+    color: #1e293b;
+}
+
+.contact-form {
+    max-width: 600px;
+    margin: 0 auto;
+    display: grid;
+    gap: 1rem;
+}
+
+.contact-form input,
+.contact-form textarea {
+    padding: 12px;
+    border: 1px solid #d1d5db;
+    border-radius: 6px;
+    font-family: inherit;
+}
+
+.contact-form textarea {
+    min-height: 120px;
+    resize: vertical;
+}
+
+/* Footer */
+.footer {
+    background: #1e293b;
+    color: white;
+    text-align: center;
+    padding: 2rem 0;
+}
+
+/* Responsive */
+@media (max-width: 768px) {
+    .nav .container {
+        flex-direction: column;
+        gap: 1rem;
+    }
+    
+    .nav-menu {
+        gap: 1rem;
+    }
+    
+    .hero h2 {
+        font-size: 2rem;
+    }
+    
+    section {
+        padding: 60px 0;
+    }
+}
+"""
+
+STATIC_SITE_JS = """
+document.addEventListener('DOMContentLoaded', function() {
+    // Smooth scrolling for navigation links
+    const navLinks = document.querySelectorAll('.nav-menu a[href^="#"]');
+    
+    navLinks.forEach(link => {
+        link.addEventListener('click', function(e) {
+            e.preventDefault();
+            
+            const targetId = this.getAttribute('href').substring(1);
+            const targetSection = document.getElementById(targetId);
+            
+            if (targetSection) {
+                const headerHeight = document.querySelector('.header').offsetHeight;
+                const targetPosition = targetSection.offsetTop - headerHeight;
+                
+                window.scrollTo({
+                    top: targetPosition,
+                    behavior: 'smooth'
+                });
+            }
+        });
+    });
+    
+    // Contact form handling
+    const contactForm = document.querySelector('.contact-form');
+    
+    if (contactForm) {
+        contactForm.addEventListener('submit', function(e) {
+            e.preventDefault();
+            
+            // Get form data
+            const formData = new FormData(this);
+            const name = this.querySelector('input[type="text"]').value;
+            const email = this.querySelector('input[type="email"]').value;
+            const message = this.querySelector('textarea').value;
+            
+            // Simple validation
+            if (!name || !email || !message) {
+                alert('Veuillez remplir tous les champs');
+                return;
+            }
+            
+            // Simulate form submission
+            alert('Merci pour votre message ! Nous vous répondrons bientôt.');
+            this.reset();
+        });
+    }
+    
+    // Add scroll effect to header
+    window.addEventListener('scroll', function() {
+        const header = document.querySelector('.header');
+        
+        if (window.scrollY > 100) {
+            header.style.background = 'rgba(255, 255, 255, 0.95)';
+            header.style.backdropFilter = 'blur(10px)';
+        } else {
+            header.style.background = '#fff';
+            header.style.backdropFilter = 'none';
+        }
+    });
+});
+"""
+
+# Templates disponibles et leurs caractéristiques
+_TEMPLATE_DEFINITIONS = {
+    "react-node-postgres": {
+        "name": "React + Node.js + PostgreSQL",
+        "description": "Stack moderne pour applications web complexes",
+        "tech_stack": ("React", "Node.js", "Express", "PostgreSQL", "Vite"),
+        "use_cases": ("spa", "dashboard", "app web", "interface utilisateur"),
+        "complexity": "high",
+        "ports": {"frontend": 3000, "backend": 5000, "db": 5432}
+    },
+    "vue-flask-postgres": {
+        "name": "Vue.js + Flask + PostgreSQL", 
+        "description": "Stack Python pour développement rapide",
+        "tech_stack": ("Vue.js", "Flask", "SQLAlchemy", "PostgreSQL"),
+        "use_cases": ("api", "prototype", "mvp", "python"),
+        "complexity": "medium",
+        "ports": {"frontend": 8080, "backend": 5000, "db": 5432}
+    },
+    "static-site": {
+        "name": "Site Statique",
+        "description": "Site web statique optimisé",
+        "tech_stack": ("HTML", "CSS", "JavaScript", "Nginx"),
+        "use_cases": ("blog", "vitrine", "documentation", "landing"),
+        "complexity": "low",
+        "ports": {"frontend": 80}
+    },
+    "api-backend": {
+        "name": "API Backend",
+        "description": "Service API backend uniquement",
+        "tech_stack": ("Node.js", "Express", "PostgreSQL", "MongoDB"),
+        "use_cases": ("api", "microservice", "backend", "service"),
+        "complexity": "medium",
+        "ports": {"backend": 5000, "db": 5432}
+    }
+}
+
+def read_only_template(template):
+    """Vue en lecture seule d'un template, ports compris"""
+    return MappingProxyType({**template, "ports": MappingProxyType(template["ports"])})
+
+def template_as_dict(template):
+    """Copie modifiable et sérialisable en JSON d'un template"""
+    return {**template, "ports": dict(template["ports"])}
+
+# Vue en lecture seule sur tous les niveaux: aucun appelant ne peut altérer les templates partagés
+TEMPLATES = MappingProxyType({
+    template_id: read_only_template(template) for template_id, template in _TEMPLATE_DEFINITIONS.items()
+})
+
+@functools.lru_cache(maxsize=None)
+def start_script_body(template_id):
+    """Partie de start.sh propre au template (ne dépend pas du projet, rendue une fois par template)"""
+    template_info = TEMPLATES[template_id]
+    
+    if template_id == "react-node-postgres":
+        return f"""
+# Démarrer la base de données
+echo -e "${{BLUE}}🗄️  Démarrage de PostgreSQL...${{NC}}"
+docker-compose up -d database
+sleep 5
+
+# Démarrer le backend
+echo -e "${{BLUE}}🔧 Démarrage du backend Node.js...${{NC}}"
+cd backend
+if [ ! -d node_modules ]; then
+    echo -e "${{YELLOW}}📦 Installation des dépendances backend...${{NC}}"
+    npm install
+fi
+npm run dev &
+BACKEND_PID=$!
+cd ..
+
+# Démarrer le frontend  
+echo -e "${{BLUE}}🎨 Démarrage du frontend React...${{NC}}"
+cd frontend
+if [ ! -d node_modules ]; then
+    echo -e "${{YELLOW}}📦 Installation des dépendances frontend...${{NC}}"
+    npm install
+fi
+npm start &
+FRONTEND_PID=$!
+cd ..
+
+echo -e "${{GREEN}}✅ Services démarrés avec succès!${{NC}}"
+echo -e "${{GREEN}}🌐 Frontend: http://localhost:{template_info['ports']['frontend']}${{NC}}"
+echo -e "${{GREEN}}🔌 Backend API: http://localhost:{template_info['ports']['backend']}${{NC}}"
+echo -e "${{GREEN}}🗄️  Database: localhost:{template_info['ports']['db']}${{NC}}"
+echo ""
+echo -e "${{BLUE}}Pour arrêter les services, utilisez Ctrl+C${{NC}}"
+
+# Attendre que l'utilisateur interrompe
+trap 'kill $BACKEND_PID $FRONTEND_PID 2>/dev/null; docker-compose stop; exit' INT
+wait
+"""
+    
+    elif template_id == "vue-flask-postgres":
+        return f"""
+# Démarrer la base de données
+echo -e "${{BLUE}}🗄️  Démarrage de PostgreSQL...${{NC}}"
+docker-compose up -d database
+sleep 5
+
+# Démarrer le backend Flask
+echo -e "${{BLUE}}🔧 Démarrage du backend Flask...${{NC}}"
+cd backend
+if [ ! -d venv ]; then
+    echo -e "${{YELLOW}}🐍 Création de l'environnement virtuel Python...${{NC}}"
+    python3 -m venv venv
+fi
+source venv/bin/activate
+if [ ! -f "requirements_installed.flag" ]; then
+    echo -e "${{YELLOW}}📦 Installation des dépendances Python...${{NC}}"
+    pip install -r requirements.txt
+    touch requirements_installed.flag
+fi
+python app.py &
+BACKEND_PID=$!
+cd ..
+
+# Démarrer le frontend Vue
+echo -e "${{BLUE}}🎨 Démarrage du frontend Vue.js...${{NC}}"
+cd frontend
+if [ ! -d node_modules ]; then
+    echo -e "${{YELLOW}}📦 Installation des dépendances frontend...${{NC}}"
+    npm install
+fi
+npm run serve &
+FRONTEND_PID=$!
+cd ..
+
+echo -e "${{GREEN}}✅ Services démarrés avec succès!${{NC}}"
+echo -e "${{GREEN}}🌐 Frontend: http://localhost:{template_info['ports']['frontend']}${{NC}}"
+echo -e "${{GREEN}}🔌 Backend API: http://localhost:{template_info['ports']['backend']}${{NC}}"
+echo -e "${{GREEN}}🗄️  Database: localhost:{template_info['ports']['db']}${{NC}}"
+echo ""
+echo -e "${{BLUE}}Pour arrêter les services, utilisez Ctrl+C${{NC}}"
+
+# Attendre que l'utilisateur interrompe
+trap 'kill $BACKEND_PID $FRONTEND_PID 2>/dev/null; docker-compose stop; exit' INT
+wait
+"""
+    
+    elif template_id == "static-site":
+        return f"""
+# Démarrer le serveur de développement
+echo -e "${{BLUE}}🌐 Démarrage du serveur de développement...${{NC}}"
+cd frontend
+
+# Utiliser live-server si disponible, sinon Python
+if command -v live-server &> /dev/null; then
+    echo -e "${{GREEN}}📡 Utilisation de live-server pour auto-reload${{NC}}"
+    npx live-server --port={template_info['ports']['frontend']} --open=/
+else
+    echo -e "${{YELLOW}}📡 Utilisation du serveur Python simple${{NC}}"
+    python3 -m http.server {template_info['ports']['frontend']}
+fi
+"""
+    
+    elif template_id == "api-backend":
+        return f"""
+# Démarrer la base de données
+echo -e "${{BLUE}}🗄️  Démarrage de PostgreSQL...${{NC}}"
+docker-compose up -d database
+sleep 5
+
+# Démarrer l'API backend
+echo -e "${{BLUE}}🔌 Démarrage de l'API backend...${{NC}}"
+cd backend
+if [ ! -d node_modules ]; then
+    echo -e "${{YELLOW}}📦 Installation des dépendances...${{NC}}"
+    npm install
+fi
+npm run dev &
+BACKEND_PID=$!
+cd ..
+
+echo -e "${{GREEN}}✅ API démarrée avec succès!${{NC}}"
+echo -e "${{GREEN}}🔌 API: http://localhost:{template_info['ports']['backend']}${{NC}}"
+echo -e "${{GREEN}}🗄️  Database: localhost:{template_info['ports']['db']}${{NC}}"
+echo -e "${{GREEN}}📖 API Docs: http://localhost:{template_info['ports']['backend']}/docs${{NC}}"
+echo ""
+echo -e "${{BLUE}}Pour arrêter les services, utilisez Ctrl+C${{NC}}"
+
+# Attendre que l'utilisateur interrompe
+trap 'kill $BACKEND_PID 2>/dev/null; docker-compose stop; exit' INT
+wait
+"""
+    
+    return ""
+
+@functools.lru_cache(maxsize=None)
+def health_checks_body(template_id):
+    """Vérifications de santé propres au template (ne dépendent que des ports, rendues une fois par template)"""
+    checks = []
+    # Ports lus une seule fois (comme pour docker-compose.yml)
+    ports = TEMPLATES.get(template_id, {}).get("ports", {})
+    frontend_port = ports.get("frontend")
+    backend_port = ports.get("backend")
+    
+    if template_id in ["react-node-postgres", "vue-flask-postgres"]:
+        checks.append(f'curl -f http://localhost:{frontend_port} > /dev/null || echo -e "${{RED}}❌ Frontend non accessible${{NC}}"')
+        checks.append(f'curl -f http://localhost:{backend_port}/health > /dev/null || echo -e "${{RED}}❌ Backend non accessible${{NC}}"')
+    elif template_id == "static-site":
+        checks.append(f'curl -f http://localhost:{frontend_port} > /dev/null || echo -e "${{RED}}❌ Site non accessible${{NC}}"')
+    elif template_id == "api-backend":
+        checks.append(f'curl -f http://localhost:{backend_port}/health > /dev/null || echo -e "${{RED}}❌ API non accessible${{NC}}"')
+    
+    return '\n'.join(checks) if checks else 'echo -e "${GREEN}✅ Aucune vérification spécifique${NC}"'
+
+def build_keyword_indexes(templates):
+    """Index des mots-clés (mot-clé -> [(template, poids)]) et des technologies de chaque template"""
+    keyword_index = {}
+    tech_index = {}
+    for template_id, template in templates.items():
+        for use_case in template["use_cases"]:
+            keyword_index.setdefault(use_case.lower(), []).append((template_id, 3))
+        for tech in template["tech_stack"]:
+            keyword_index.setdefault(tech.lower(), []).append((template_id, 2))
+        tech_index[template_id] = frozenset(tech.lower() for tech in template["tech_stack"])
+    return keyword_index, tech_index
+
 class MetaAgent:
     """Agent Meta pour l'orchestration des projets Claude Code"""
     
+    # Templates disponibles (vue en lecture seule partagée par toutes les instances)
+    templates = TEMPLATES
+    
+    # Règles de conformité (basées sur CLAUDE.md)
+    compliance_rules = {
+        "mandatory_files": (
+            "docker-compose.yml",
+            "README.md",
+            ".env.example"
+        ),
+        "mandatory_labels": (
+            "traefik.enable=true",
+            "traefik.http.routers.{app}.rule=Host(`{app}.colaig.fr`)",
+            "traefik.http.routers.{app}.entrypoints=websecure",
+            "traefik.http.routers.{app}.tls=true",
+            "traefik.http.routers.{app}.tls.certresolver=letsencrypt"
+        ),
+        "required_structure": (
+            "frontend/",
+            "backend/", 
+            "database/",
+            "tests/",
+            "docs/"
+        ),
+        "environments": ("development", "staging", "production")
+    }
+    
+    # Index des mots-clés en minuscules, construits une seule fois pour la classe
+    _keyword_index, _tech_index = build_keyword_indexes(templates)
+    
     def __init__(self, docker_path="/root/docker"):
         self.docker_path = docker_path
         self.apps_path = os.path.join(docker_path, "apps")
         self.templates_path = os.path.join(docker_path, "templates")
         self.claude_md_path = os.path.join(docker_path, "CLAUDE.md")
-        
-        # Templates disponibles et leurs caractéristiques
-        self.templates = {
-            "react-node-postgres": {
-                "name": "React + Node.js + PostgreSQL",
-                "description": "Stack moderne pour applications web complexes",
-                "tech_stack": ["React", "Node.js", "Express", "PostgreSQL", "Vite"],
-                "use_cases": ["spa", "dashboard", "app web", "interface utilisateur"],
-                "complexity": "high",
-                "ports": {"frontend": 3000, "backend": 5000, "db": 5432}
-            },
-            "vue-flask-postgres": {
-                "name": "Vue.js + Flask + PostgreSQL", 
-                "description": "Stack Python pour développement rapide",
-                "tech_stack": ["Vue.js", "Flask", "SQLAlchemy", "PostgreSQL"],
-                "use_cases": ["api", "prototype", "mvp", "python"],
-                "complexity": "medium",
-                "ports": {"frontend": 8080, "backend": 5000, "db": 5432}
-            },
-            "static-site": {
-                "name": "Site Statique",
-                "description": "Site web statique optimisé",
-                "tech_stack": ["HTML", "CSS", "JavaScript", "Nginx"],
-                "use_cases": ["blog", "vitrine", "documentation", "landing"],
-                "complexity": "low",
-                "ports": {"frontend": 80}
-            },
-            "api-backend": {
-                "name": "API Backend",
-                "description": "Service API backend uniquement",
-                "tech_stack": ["Node.js", "Express", "PostgreSQL", "MongoDB"],
-                "use_cases": ["api", "microservice", "backend", "service"],
-                "complexity": "medium",
-                "ports": {"backend": 5000, "db": 5432}
-            }
-        }
-        
-        # Règles de conformité (basées sur CLAUDE.md)
-        self.compliance_rules = {
-            "mandatory_files": [
-                "docker-compose.yml",
-                "README.md",
-                ".env.example"
-            ],
-            "mandatory_labels": [
-                "traefik.enable=true",
-                "traefik.http.routers.{app}.rule=Host(`{app}.colaig.fr`)",
-                "traefik.http.routers.{app}.entrypoints=websecure",
-                "traefik.http.routers.{app}.tls=true",
-                "traefik.http.routers.{app}.tls.certresolver=letsencrypt"
-            ],
-            "required_structure": [
-                "frontend/",
-                "backend/", 
-                "database/",
-                "tests/",
-                "docs/"
-            ],
-            "environments": ["development", "staging", "production"]
-        }
 
     def analyze_project_requirements(self, description, preferences=None):
         """Analyse les exigences du projet et recommande un template"""
         description_lower = description.lower()
         preferences = preferences or {}
         
-        scores = {}
+        scores = dict.fromkeys(self.templates, 0)
         
+        # Score basé sur les cas d'usage (3) et technologies (2) mentionnés dans la description:
+        # une seule recherche par mot-clé, même s'il est partagé par plusieurs templates
+        for keyword, weights in self._keyword_index.items():
+            if keyword in description_lower:
+                for template_id, weight in weights:
+                    scores[template_id] += weight
+        
+        # Ajustements basés sur les préférences, en retenant le meilleur score au passage
+        # (le premier template à égalité l'emporte, comme avec max())
+        preferred_tech = [tech.lower() for tech in preferences.get("preferred_tech") or ()]
+        best_template, best_score = None, -1
         for template_id, template in self.templates.items():
-            score = 0
-            
-            # Score basé sur les mots-clés dans la description
-            for use_case in template["use_cases"]:
-                if use_case in description_lower:
-                    score += 3
-            
-            # Score basé sur les technologies mentionnées
-            for tech in template["tech_stack"]:
-                if tech.lower() in description_lower:
-                    score += 2
-            
-            # Ajustements basés sur les préférences
+            score = scores[template_id]
             if preferences.get("complexity") == template["complexity"]:
                 score += 1
             
-            if preferences.get("preferred_tech"):
-                for tech in preferences["preferred_tech"]:
-                    if tech.lower() in [t.lower() for t in template["tech_stack"]]:
-                        score += 2
+            for tech in preferred_tech:
+                if tech in self._tech_index[template_id]:
+                    score += 2
             
             scores[template_id] = score
+            if score > best_score:
+                best_template, best_score = template_id, score
         
         # Retourner le template avec le meilleur score
-        best_template = max(scores, key=scores.get)
         
-        logger.info(f"Analyse terminée - Template recommandé: {best_template} (score: {scores[best_template]})")
-        logger.info(f"Scores détaillés: {scores}")
+        # Formatage différé: le dictionnaire des scores n'est converti que si le message est émis
+        logger.info("Analyse terminée - Template recommandé: %s (score: %d)", best_template, best_score)
+        logger.info("Scores détaillés: %s", scores)
         
         return {
             "recommended": best_template,
             "scores": scores,
-            "template_info": self.templates[best_template]
+            "template_info": template_as_dict(self.templates[best_template])
         }
 
     def create_project(self, project_name, template_id, description, user_preferences=None):
         """Crée un projet complet avec le template spécifié"""
         logger.info(f"Création du projet '{project_name}' avec le template '{template_id}'")
         
+        # Date commune à tous les fichiers générés
+        created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
         # Valider les entrées
         if not self._validate_project_inputs(project_name, template_id):
             raise ValueError("Paramètres de projet invalides")
         
         project_path = os.path.join(self.apps_path, project_name)
         
-        # Vérifier que le projet n'existe pas déjà
-        if os.path.exists(project_path):
-            raise FileExistsError(f"Le projet '{project_name}' existe déjà")
+        # Réserver le nom du projet: la vérification d'existence et la création sont atomiques
+        try:
+            os.mkdir(project_path)
+        except FileExistsError:
+            raise FileExistsError(f"Le projet '{project_name}' existe déjà") from None
+        except FileNotFoundError:
+            # Dossier apps absent (première installation)
+            os.makedirs(project_path)
+        
+        # Le projet est construit dans un dossier caché puis renommé d'un bloc:
+        # le dossier réservé ne contient jamais une arborescence partielle
+        staging_path = os.path.join(self.apps_path, f".{project_name}.tmp-{os.getpid()}-{time.monotonic_ns()}")
         
         try:
+            os.mkdir(staging_path)
+            
             # 1. Créer la structure de base
-            self._create_base_structure(project_path, project_name)
+            self._create_base_structure(staging_path, project_name)
             
             # 2. Copier et adapter le template
-            self._apply_template(project_path, template_id, project_name)
+            self._apply_template(staging_path, template_id, project_name)
             
             # 3. Générer les fichiers de configuration
-            self._generate_config_files(project_path, project_name, template_id, description)
+            self._generate_config_files(staging_path, project_name, template_id, description, created_at)
             
             # 4. Appliquer les règles de conformité
-            self._apply_compliance_rules(project_path, project_name, template_id)
+            self._apply_compliance_rules(staging_path, project_name, template_id)
             
             # 5. Initialiser les tests
-            self._setup_testing_framework(project_path, template_id)
+            self._setup_testing_framework(staging_path, template_id)
             
             # 6. Créer la documentation
-            self._generate_documentation(project_path, project_name, template_id, description)
+            self._generate_documentation(staging_path, project_name, template_id, description)
+            
+            # 7. Remplacer atomiquement le dossier réservé (vide) par le projet complet
+            os.rename(staging_path, project_path)
             
             logger.info(f"Projet '{project_name}' créé avec succès")
             
@@ -182,33 +1186,26 @@ class MetaAgent:
             }
             
         except Exception as e:
-            # Nettoyer en cas d'erreur
-            if os.path.exists(project_path):
-                shutil.rmtree(project_path)
+            # Nettoyer en cas d'erreur: dossier de travail et réservation du nom
+            shutil.rmtree(staging_path, ignore_errors=True)
+            try:
+                os.rmdir(project_path)
+            except OSError:
+                pass
             logger.error(f"Erreur lors de la création du projet: {str(e)}")
             raise
 
     def _validate_project_inputs(self, project_name, template_id):
         """Valide les paramètres d'entrée du projet"""
-        # Valider le nom du projet
-        if not project_name or not project_name.replace("-", "").replace("_", "").isalnum():
-            return False
-        
-        # Valider le template
-        if template_id not in self.templates:
-            return False
-        
-        return True
+        # Nom du projet validé en un seul passage, template par recherche dans le dictionnaire
+        return bool(project_name and PROJECT_NAME_PATTERN.match(project_name)) and template_id in self.templates
 
     def _create_base_structure(self, project_path, project_name):
         """Crée la structure de dossiers de base"""
         logger.info(f"Création de la structure de base pour {project_name}")
         
-        os.makedirs(project_path, exist_ok=True)
-        
-        # Créer les dossiers obligatoires
-        for folder in ["frontend", "backend", "database", "tests", "docs"]:
-            os.makedirs(os.path.join(project_path, folder), exist_ok=True)
+        # Créer les dossiers obligatoires (le dossier du projet vient d'être créé par create_project)
+        make_dirs(project_path, *BASE_FOLDERS)
 
     def _apply_template(self, project_path, template_id, project_name):
         """Copie et adapte le template choisi"""
@@ -216,24 +1213,25 @@ class MetaAgent:
         
         template_path = os.path.join(self.templates_path, template_id)
         
-        # Si le template existe physiquement, le copier
-        if os.path.exists(template_path):
-            for item in os.listdir(template_path):
-                src = os.path.join(template_path, item)
-                dst = os.path.join(project_path, item)
-                
-                if os.path.isdir(src):
-                    shutil.copytree(src, dst, dirs_exist_ok=True)
-                else:
-                    shutil.copy2(src, dst)
-        else:
+        # Si le template existe physiquement, le copier (scandir fournit le type des entrées sans stat)
+        try:
+            entries = os.scandir(template_path)
+        except FileNotFoundError:
             # Générer la structure selon le template
             self._generate_template_structure(project_path, template_id, project_name)
+            return
+        
+        with entries:
+            for entry in entries:
+                dst = os.path.join(project_path, entry.name)
+                
+                if entry.is_dir():
+                    shutil.copytree(entry.path, dst, copy_function=clone_file, dirs_exist_ok=True)
+                else:
+                    clone_file(entry.path, dst)
 
     def _generate_template_structure(self, project_path, template_id, project_name):
         """Génère la structure du template si les fichiers template n'existent pas"""
-        template_info = self.templates[template_id]
-        
         if template_id == "react-node-postgres":
             self._create_react_node_structure(project_path, project_name)
         elif template_id == "vue-flask-postgres":
@@ -243,12 +1241,12 @@ class MetaAgent:
         elif template_id == "api-backend":
             self._create_api_backend_structure(project_path, project_name)
 
-    def _generate_config_files(self, project_path, project_name, template_id, description):
+    def _generate_config_files(self, project_path, project_name, template_id, description, created_at):
         """Génère les fichiers de configuration"""
         logger.info("Génération des fichiers de configuration")
         
         # Générer CLAUDE.md spécialisé (NOUVEAU)
-        self._generate_specialized_claude_md(project_path, project_name, template_id, description)
+        self._generate_specialized_claude_md(project_path, project_name, template_id, description, created_at)
         
         # Générer docker-compose.yml
         self._generate_docker_compose(project_path, project_name, template_id)
@@ -257,23 +1255,24 @@ class MetaAgent:
         self._generate_env_example(project_path, template_id)
         
         # Générer README.md
-        self._generate_readme(project_path, project_name, template_id, description)
+        self._generate_readme(project_path, project_name, template_id, description, created_at)
         
         # Générer scripts de développement (NOUVEAU)
         self._generate_development_scripts(project_path, project_name, template_id)
 
     def _generate_docker_compose(self, project_path, project_name, template_id):
         """Génère le fichier docker-compose.yml avec les labels Traefik"""
-        template_info = self.templates[template_id]
-        ports = template_info["ports"]
+        ports = self.templates[template_id]["ports"]
+        # Ports lus une seule fois: None si le service n'existe pas dans ce template
+        frontend_port = ports.get("frontend")
+        backend_port = ports.get("backend")
+        db_port = ports.get("db")
         
-        compose_content = f"""version: '3.8'
-
-services:"""
+        compose_parts = [COMPOSE_HEADER]
 
         # Frontend (si applicable)
-        if "frontend" in ports:
-            compose_content += f"""
+        if frontend_port is not None:
+            compose_parts.append(f"""
   frontend:
     build: ./frontend
     container_name: {project_name}-frontend
@@ -290,17 +1289,17 @@ services:"""
       - "traefik.http.routers.{project_name}.entrypoints=websecure"
       - "traefik.http.routers.{project_name}.tls=true"
       - "traefik.http.routers.{project_name}.tls.certresolver=letsencrypt"
-      - "traefik.http.services.{project_name}.loadbalancer.server.port={ports['frontend']}"
+      - "traefik.http.services.{project_name}.loadbalancer.server.port={frontend_port}"
       - "traefik.docker.network=proxy"
       - "traefik.http.routers.{project_name}-staging.rule=Host(`{project_name}-staging.colaig.fr`)"
       - "traefik.http.routers.{project_name}-staging.entrypoints=websecure"
       - "traefik.http.routers.{project_name}-staging.tls=true"
       - "traefik.http.routers.{project_name}-staging.tls.certresolver=letsencrypt"
-"""
+""")
 
         # Backend (si applicable)
-        if "backend" in ports:
-            compose_content += f"""
+        if backend_port is not None:
+            compose_parts.append(f"""
   backend:
     build: ./backend
     container_name: {project_name}-backend
@@ -320,13 +1319,13 @@ services:"""
       - "traefik.http.routers.{project_name}-api.entrypoints=websecure"
       - "traefik.http.routers.{project_name}-api.tls=true"
       - "traefik.http.routers.{project_name}-api.tls.certresolver=letsencrypt"
-      - "traefik.http.services.{project_name}-api.loadbalancer.server.port={ports['backend']}"
+      - "traefik.http.services.{project_name}-api.loadbalancer.server.port={backend_port}"
       - "traefik.docker.network=proxy"
-"""
+""")
 
         # Database (si applicable)
-        if "db" in ports:
-            compose_content += f"""
+        if db_port is not None:
+            compose_parts.append(f"""
   database:
     image: postgres:15
     container_name: {project_name}-db
@@ -345,23 +1344,12 @@ services:"""
       interval: 30s
       timeout: 10s
       retries: 3
-"""
+""")
 
         # Networks et volumes
-        compose_content += f"""
-
-networks:
-  proxy:
-    external: true
-  internal:
-    driver: bridge
-
-volumes:
-  postgres_data:
-"""
+        compose_parts.append(COMPOSE_FOOTER)
 
-        with open(os.path.join(project_path, "docker-compose.yml"), "w") as f:
-            f.write(compose_content)
+        write_text(os.path.join(project_path, "docker-compose.yml"), "".join(compose_parts))
 
     def _generate_env_example(self, project_path, template_id):
         """Génère le fichier .env.example"""
@@ -388,10 +1376,9 @@ FRONTEND_URL=http://localhost:3000
 BACKEND_URL=http://localhost:5000
 """
 
-        with open(os.path.join(project_path, ".env.example"), "w") as f:
-            f.write(env_content)
+        write_text(os.path.join(project_path, ".env.example"), env_content)
 
-    def _generate_readme(self, project_path, project_name, template_id, description):
+    def _generate_readme(self, project_path, project_name, template_id, description, created_at):
         """Génère le README.md du projet"""
         template_info = self.templates[template_id]
         
@@ -424,7 +1411,7 @@ cp .env.example .env
 nano .env
 
 # Démarrer les services
-docker-compose up -d --build
+COMPOSE_DOCKER_CLI_BUILD=1 DOCKER_BUILDKIT=1 docker-compose up -d --build
 
 # Voir les logs
 docker-compose logs -f
@@ -451,7 +1438,7 @@ cd frontend && npm test
 cd backend && npm test
 
 # Tests complets
-docker-compose -f docker-compose.test.yml up --build
+COMPOSE_DOCKER_CLI_BUILD=1 DOCKER_BUILDKIT=1 docker-compose -f docker-compose.test.yml up --build
 ```
 
 ## 📁 Structure du projet
@@ -479,20 +1466,19 @@ Le déploiement se fait automatiquement via Docker et Traefik :
 Consultez le dossier `docs/` pour une documentation détaillée.
 
 ---
-*Projet créé le {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} avec Claude Code Web*
+*Projet créé le {created_at} avec Claude Code Web*
 """
 
-        with open(os.path.join(project_path, "README.md"), "w", encoding="utf-8") as f:
-            f.write(readme_content)
+        write_text(os.path.join(project_path, "README.md"), readme_content)
 
-    def _generate_specialized_claude_md(self, project_path, project_name, template_id, description):
+    def _generate_specialized_claude_md(self, project_path, project_name, template_id, description, created_at):
         """Génère un fichier CLAUDE.md spécialisé pour le projet"""
         logger.info(f"Génération du CLAUDE.md spécialisé pour {template_id}")
         
         template_info = self.templates[template_id]
         
         # Base commune pour tous les CLAUDE.md
-        claude_md_content = f"""# CLAUDE.md
+        claude_md_parts = [f"""# CLAUDE.md
 
 This file provides guidance to Claude Code (claude.ai/code) when working with code in this repository.
 
@@ -510,357 +1496,105 @@ This file provides guidance to Claude Code (claude.ai/code) when working with co
 
 ## Architecture
 
-"""
+"""]
         
         # Ajouter l'architecture spécifique selon le template
         if template_id == "react-node-postgres":
-            claude_md_content += self._get_react_node_architecture(project_name, template_info)
-        elif template_id == "vue-flask-postgres":
-            claude_md_content += self._get_vue_flask_architecture(project_name, template_info)
-        elif template_id == "static-site":
-            claude_md_content += self._get_static_site_architecture(project_name, template_info)
-        elif template_id == "api-backend":
-            claude_md_content += self._get_api_backend_architecture(project_name, template_info)
-        
-        # Section commune de développement
-        claude_md_content += f"""
-
-## Development Commands
-
-### Quick Start
-```bash
-# Copy environment variables
-cp .env.example .env
-
-# Edit configuration
-nano .env
-
-# Start all services
-docker-compose up -d --build
-
-# View logs
-docker-compose logs -f
-```
-
-### Development Workflow
-```bash
-# Development mode
-./scripts/start.sh
-
-# Build for production  
-./scripts/build.sh
-
-# Run tests
-./scripts/test.sh
-
-# Deploy to staging
-./scripts/deploy.sh staging
-```
-
-### Container Management
-```bash
-# Stop all services
-docker-compose down
-
-# Restart specific service
-docker-compose restart frontend
-
-# Rebuild and restart
-docker-compose up -d --build frontend
-
-# View service logs
-docker-compose logs -f frontend
-```
-
-## Environment URLs
-
-### Development
-- Frontend: http://localhost:{template_info['ports'].get('frontend', 3000)}"""
-        
-        if 'backend' in template_info['ports']:
-            claude_md_content += f"""
-- Backend API: http://localhost:{template_info['ports']['backend']}"""
-        
-        if 'db' in template_info['ports']:
-            claude_md_content += f"""
-- Database: localhost:{template_info['ports']['db']}"""
-            
-        claude_md_content += f"""
-
-### Staging
-- Frontend: https://{project_name}-staging.colaig.fr"""
-        
-        if 'backend' in template_info['ports']:
-            claude_md_content += f"""
-- API: https://{project_name}-api-staging.colaig.fr"""
-            
-        claude_md_content += f"""
-
-### Production  
-- Frontend: https://{project_name}.colaig.fr"""
-        
-        if 'backend' in template_info['ports']:
-            claude_md_content += f"""
-- API: https://{project_name}-api.colaig.fr"""
-
-        # Ajouter les spécificités de développement selon le template
-        claude_md_content += self._get_template_specific_guidance(template_id, project_name, template_info)
-        
-        # Footer commun
-        claude_md_content += f"""
-
-## Code Conventions
-
-### Naming
-- Files: kebab-case (my-component.js)
-- Variables: camelCase (myVariable)
-- Constants: UPPER_SNAKE_CASE (API_URL)
-- Components: PascalCase (MyComponent)
-
-### Git Workflow
-- Main branch: `main`
-- Feature branches: `feature/feature-name`
-- Commit format: `type: description` (feat: add user authentication)
-
-## Deployment
-
-### Docker & Traefik
-All services are automatically configured with:
-- SSL certificates via Let's Encrypt
-- Reverse proxy routing
-- Health checks
-- Auto-restart policies
-
-### Environment Variables
-Required variables are documented in `.env.example`. Never commit actual `.env` files.
-
-### Database
-Database migrations and seeds are in the `database/` directory.
-
-## Security Considerations
-
-- All secrets in environment variables
-- HTTPS only in production
-- CORS configured for specific origins
-- Database access restricted to backend services
-- Regular security updates via Docker images
-
----
-
-*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} by Claude Code Web Meta Agent*
-"""
-        
-        with open(os.path.join(project_path, "CLAUDE.md"), "w", encoding="utf-8") as f:
-            f.write(claude_md_content)
-
-    def _generate_development_scripts(self, project_path, project_name, template_id):
-        """Génère les scripts de développement automatiques"""
-        logger.info("Génération des scripts de développement")
-        
-        scripts_path = os.path.join(project_path, "scripts")
-        os.makedirs(scripts_path, exist_ok=True)
-        
-        template_info = self.templates[template_id]
-        
-        # Script start.sh - Démarrage développement
-        start_script = self._generate_start_script(template_id, project_name, template_info)
-        with open(os.path.join(scripts_path, "start.sh"), "w") as f:
-            f.write(start_script)
-        os.chmod(os.path.join(scripts_path, "start.sh"), 0o755)
-        
-        # Script build.sh - Build production
-        build_script = self._generate_build_script(template_id, project_name, template_info)
-        with open(os.path.join(scripts_path, "build.sh"), "w") as f:
-            f.write(build_script)
-        os.chmod(os.path.join(scripts_path, "build.sh"), 0o755)
-        
-        # Script test.sh - Tests automatisés
-        test_script = self._generate_test_script(template_id, project_name, template_info)
-        with open(os.path.join(scripts_path, "test.sh"), "w") as f:
-            f.write(test_script)
-        os.chmod(os.path.join(scripts_path, "test.sh"), 0o755)
-        
-        # Script deploy.sh - Déploiement
-        deploy_script = self._generate_deploy_script(template_id, project_name, template_info)
-        with open(os.path.join(scripts_path, "deploy.sh"), "w") as f:
-            f.write(deploy_script)
-        os.chmod(os.path.join(scripts_path, "deploy.sh"), 0o755)
-
-    def _generate_start_script(self, template_id, project_name, template_info):
-        """Génère le script start.sh selon le template"""
-        base_script = f"""#!/bin/bash
-# Script de démarrage pour {project_name}
-# Template: {template_id}
-
-set -e
-
-GREEN='\\033[0;32m'
-BLUE='\\033[0;34m'
-YELLOW='\\033[1;33m'
-RED='\\033[0;31m'
-NC='\\033[0m'
-
-echo -e "${{BLUE}}🚀 Démarrage de {project_name}${{NC}}"
-echo -e "${{BLUE}}============================${{NC}}"
-
-# Vérifier que .env existe
-if [ ! -f .env ]; then
-    echo -e "${{YELLOW}}⚠️  Fichier .env manquant, copie depuis .env.example${{NC}}"
-    cp .env.example .env
-    echo -e "${{YELLOW}}📝 Veuillez modifier .env selon vos besoins${{NC}}"
-fi
-
-"""
-        
-        if template_id == "react-node-postgres":
-            base_script += f"""
-# Démarrer la base de données
-echo -e "${{BLUE}}🗄️  Démarrage de PostgreSQL...${{NC}}"
-docker-compose up -d database
-sleep 5
-
-# Démarrer le backend
-echo -e "${{BLUE}}🔧 Démarrage du backend Node.js...${{NC}}"
-cd backend
-if [ ! -d node_modules ]; then
-    echo -e "${{YELLOW}}📦 Installation des dépendances backend...${{NC}}"
-    npm install
-fi
-npm run dev &
-BACKEND_PID=$!
-cd ..
-
-# Démarrer le frontend  
-echo -e "${{BLUE}}🎨 Démarrage du frontend React...${{NC}}"
-cd frontend
-if [ ! -d node_modules ]; then
-    echo -e "${{YELLOW}}📦 Installation des dépendances frontend...${{NC}}"
-    npm install
-fi
-npm start &
-FRONTEND_PID=$!
-cd ..
-
-echo -e "${{GREEN}}✅ Services démarrés avec succès!${{NC}}"
-echo -e "${{GREEN}}🌐 Frontend: http://localhost:{template_info['ports']['frontend']}${{NC}}"
-echo -e "${{GREEN}}🔌 Backend API: http://localhost:{template_info['ports']['backend']}${{NC}}"
-echo -e "${{GREEN}}🗄️  Database: localhost:{template_info['ports']['db']}${{NC}}"
-echo ""
-echo -e "${{BLUE}}Pour arrêter les services, utilisez Ctrl+C${{NC}}"
-
-# Attendre que l'utilisateur interrompe
-trap 'kill $BACKEND_PID $FRONTEND_PID 2>/dev/null; docker-compose stop; exit' INT
-wait
-"""
-        
+            claude_md_parts.append(self._get_react_node_architecture(project_name, template_info))
         elif template_id == "vue-flask-postgres":
-            base_script += f"""
-# Démarrer la base de données
-echo -e "${{BLUE}}🗄️  Démarrage de PostgreSQL...${{NC}}"
-docker-compose up -d database
-sleep 5
+            claude_md_parts.append(self._get_vue_flask_architecture(project_name, template_info))
+        elif template_id == "static-site":
+            claude_md_parts.append(self._get_static_site_architecture(project_name, template_info))
+        elif template_id == "api-backend":
+            claude_md_parts.append(self._get_api_backend_architecture(project_name, template_info))
+        
+        # Section commune de développement
+        claude_md_parts.append(CLAUDE_MD_COMMANDS)
+        
+        # Ports lus une seule fois pour le bloc des URLs
+        ports = template_info['ports']
+        backend_port = ports.get('backend')
+        db_port = ports.get('db')
+        claude_md_parts.append(f"""## Environment URLs
 
-# Démarrer le backend Flask
-echo -e "${{BLUE}}🔧 Démarrage du backend Flask...${{NC}}"
-cd backend
-if [ ! -d venv ]; then
-    echo -e "${{YELLOW}}🐍 Création de l'environnement virtuel Python...${{NC}}"
-    python3 -m venv venv
-fi
-source venv/bin/activate
-if [ ! -f "requirements_installed.flag" ]; then
-    echo -e "${{YELLOW}}📦 Installation des dépendances Python...${{NC}}"
-    pip install -r requirements.txt
-    touch requirements_installed.flag
-fi
-python app.py &
-BACKEND_PID=$!
-cd ..
+### Development
+- Frontend: http://localhost:{ports.get('frontend', 3000)}""")
+        
+        if backend_port is not None:
+            claude_md_parts.append(f"""
+- Backend API: http://localhost:{backend_port}""")
+        
+        if db_port is not None:
+            claude_md_parts.append(f"""
+- Database: localhost:{db_port}""")
+            
+        claude_md_parts.append(f"""
 
-# Démarrer le frontend Vue
-echo -e "${{BLUE}}🎨 Démarrage du frontend Vue.js...${{NC}}"
-cd frontend
-if [ ! -d node_modules ]; then
-    echo -e "${{YELLOW}}📦 Installation des dépendances frontend...${{NC}}"
-    npm install
-fi
-npm run serve &
-FRONTEND_PID=$!
-cd ..
+### Staging
+- Frontend: https://{project_name}-staging.colaig.fr""")
+        
+        if backend_port is not None:
+            claude_md_parts.append(f"""
+- API: https://{project_name}-api-staging.colaig.fr""")
+            
+        claude_md_parts.append(f"""
 
-echo -e "${{GREEN}}✅ Services démarrés avec succès!${{NC}}"
-echo -e "${{GREEN}}🌐 Frontend: http://localhost:{template_info['ports']['frontend']}${{NC}}"
-echo -e "${{GREEN}}🔌 Backend API: http://localhost:{template_info['ports']['backend']}${{NC}}"
-echo -e "${{GREEN}}🗄️  Database: localhost:{template_info['ports']['db']}${{NC}}"
-echo ""
-echo -e "${{BLUE}}Pour arrêter les services, utilisez Ctrl+C${{NC}}"
+### Production  
+- Frontend: https://{project_name}.colaig.fr""")
+        
+        if backend_port is not None:
+            claude_md_parts.append(f"""
+- API: https://{project_name}-api.colaig.fr""")
 
-# Attendre que l'utilisateur interrompe
-trap 'kill $BACKEND_PID $FRONTEND_PID 2>/dev/null; docker-compose stop; exit' INT
-wait
-"""
+        # Ajouter les spécificités de développement selon le template
+        claude_md_parts.append(self._get_template_specific_guidance(template_id, project_name, template_info))
         
-        elif template_id == "static-site":
-            base_script += f"""
-# Démarrer le serveur de développement
-echo -e "${{BLUE}}🌐 Démarrage du serveur de développement...${{NC}}"
-cd frontend
+        # Footer commun
+        claude_md_parts.append(CLAUDE_MD_FOOTER)
+        claude_md_parts.append(f"""*Generated on {created_at} by Claude Code Web Meta Agent*
+""")
+        
+        write_text(os.path.join(project_path, "CLAUDE.md"), "".join(claude_md_parts))
 
-# Utiliser live-server si disponible, sinon Python
-if command -v live-server &> /dev/null; then
-    echo -e "${{GREEN}}📡 Utilisation de live-server pour auto-reload${{NC}}"
-    npx live-server --port={template_info['ports']['frontend']} --open=/
-else
-    echo -e "${{YELLOW}}📡 Utilisation du serveur Python simple${{NC}}"
-    python3 -m http.server {template_info['ports']['frontend']}
-fi
-"""
+    def _generate_development_scripts(self, project_path, project_name, template_id):
+        """Génère les scripts de développement automatiques"""
+        logger.info("Génération des scripts de développement")
         
-        elif template_id == "api-backend":
-            base_script += f"""
-# Démarrer la base de données
-echo -e "${{BLUE}}🗄️  Démarrage de PostgreSQL...${{NC}}"
-docker-compose up -d database
-sleep 5
+        scripts_path = os.path.join(project_path, "scripts")
+        make_dirs(project_path, "scripts")
+        
+        template_info = self.templates[template_id]
+        
+        scripts = {
+            "start.sh": self._generate_start_script,    # Démarrage développement
+            "build.sh": self._generate_build_script,    # Build production
+            "test.sh": self._generate_test_script,      # Tests automatisés
+            "deploy.sh": self._generate_deploy_script   # Déploiement
+        }
+        for script_name, generate_script in scripts.items():
+            content = generate_script(template_id, project_name, template_info)
+            write_text(os.path.join(scripts_path, script_name), content, 0o755)
 
-# Démarrer l'API backend
-echo -e "${{BLUE}}🔌 Démarrage de l'API backend...${{NC}}"
-cd backend
-if [ ! -d node_modules ]; then
-    echo -e "${{YELLOW}}📦 Installation des dépendances...${{NC}}"
-    npm install
-fi
-npm run dev &
-BACKEND_PID=$!
-cd ..
+    def _generate_start_script(self, template_id, project_name, template_info):
+        """Génère le script start.sh selon le template"""
+        base_script = script_header("démarrage", project_name, template_id) + f"""
 
-echo -e "${{GREEN}}✅ API démarrée avec succès!${{NC}}"
-echo -e "${{GREEN}}🔌 API: http://localhost:{template_info['ports']['backend']}${{NC}}"
-echo -e "${{GREEN}}🗄️  Database: localhost:{template_info['ports']['db']}${{NC}}"
-echo -e "${{GREEN}}📖 API Docs: http://localhost:{template_info['ports']['backend']}/docs${{NC}}"
-echo ""
-echo -e "${{BLUE}}Pour arrêter les services, utilisez Ctrl+C${{NC}}"
+echo -e "${{BLUE}}🚀 Démarrage de {project_name}${{NC}}"
+echo -e "${{BLUE}}============================${{NC}}"
+
+# Vérifier que .env existe
+if [ ! -f .env ]; then
+    echo -e "${{YELLOW}}⚠️  Fichier .env manquant, copie depuis .env.example${{NC}}"
+    cp .env.example .env
+    echo -e "${{YELLOW}}📝 Veuillez modifier .env selon vos besoins${{NC}}"
+fi
 
-# Attendre que l'utilisateur interrompe
-trap 'kill $BACKEND_PID 2>/dev/null; docker-compose stop; exit' INT
-wait
 """
-        
-        return base_script
+        return base_script + start_script_body(template_id)
 
     def _generate_build_script(self, template_id, project_name, template_info):
         """Génère le script build.sh selon le template"""
-        return f"""#!/bin/bash
-# Script de build pour {project_name}
-# Template: {template_id}
-
-set -e
-
-GREEN='\\033[0;32m'
-BLUE='\\033[0;34m'
-YELLOW='\\033[1;33m'
-RED='\\033[0;31m'
-NC='\\033[0m'
+        return script_header("build", project_name, template_id) + f"""
 
 echo -e "${{BLUE}}🔨 Build de {project_name}${{NC}}"
 echo -e "${{BLUE}}=====================${{NC}}"
@@ -874,17 +1608,7 @@ echo -e "${{BLUE}}🚀 Prêt pour le déploiement${{NC}}"
 
     def _generate_test_script(self, template_id, project_name, template_info):
         """Génère le script test.sh selon le template"""
-        return f"""#!/bin/bash
-# Script de tests pour {project_name}
-# Template: {template_id}
-
-set -e
-
-GREEN='\\033[0;32m'
-BLUE='\\033[0;34m'
-YELLOW='\\033[1;33m'
-RED='\\033[0;31m'
-NC='\\033[0m'
+        return script_header("tests", project_name, template_id) + f"""
 
 echo -e "${{BLUE}}🧪 Tests de {project_name}${{NC}}"
 echo -e "${{BLUE}}==================${{NC}}"
@@ -897,17 +1621,7 @@ echo -e "${{GREEN}}✅ Tous les tests sont passés!${{NC}}"
 
     def _generate_deploy_script(self, template_id, project_name, template_info):
         """Génère le script deploy.sh selon le template"""
-        return f"""#!/bin/bash
-# Script de déploiement pour {project_name}
-# Template: {template_id}
-
-set -e
-
-GREEN='\\033[0;32m'
-BLUE='\\033[0;34m'
-YELLOW='\\033[1;33m'
-RED='\\033[0;31m'
-NC='\\033[0m'
+        return script_header("déploiement", project_name, template_id) + f"""
 
 ENVIRONMENT=${{1:-staging}}
 
@@ -920,200 +1634,42 @@ if [[ "$ENVIRONMENT" != "staging" && "$ENVIRONMENT" != "production" ]]; then
     exit 1
 fi
 
-# Build avant déploiement
-echo -e "${{BLUE}}🔨 Build de l'application...${{NC}}"
-./scripts/build.sh
-
-# Tests avant déploiement
-echo -e "${{BLUE}}🧪 Exécution des tests...${{NC}}"
-./scripts/test.sh
-
-# Déploiement Docker
-echo -e "${{BLUE}}🐳 Déploiement Docker...${{NC}}"
-docker-compose down
-docker-compose up -d --build
-
-# Attendre que les services soient prêts
-echo -e "${{YELLOW}}⏳ Attente de la disponibilité des services...${{NC}}"
-sleep 10
-
-# Vérification de santé
-echo -e "${{BLUE}}🏥 Vérification de la santé des services...${{NC}}"
-{self._get_health_checks(template_id, project_name)}
-
-echo -e "${{GREEN}}✅ Déploiement réussi!${{NC}}"
-echo -e "${{GREEN}}🌐 URL $ENVIRONMENT: https://{project_name}{"-$ENVIRONMENT" if "$ENVIRONMENT" == "staging" else ""}.colaig.fr${{NC}}"
-"""
-
-    def _get_build_commands(self, template_id):
-        """Retourne les commandes de build selon le template"""
-        if template_id == "react-node-postgres":
-            return """
-# Build frontend React
-echo -e "${BLUE}🎨 Build du frontend React...${NC}"
-cd frontend
-npm install
-npm run build
-cd ..
-
-# Build backend Node.js  
-echo -e "${BLUE}🔧 Build du backend Node.js...${NC}"
-cd backend
-npm install
-# Pas de build spécifique pour Node.js en général
-cd ..
-
-# Build des images Docker
-echo -e "${BLUE}🐳 Build des images Docker...${NC}"
-docker-compose build
-"""
-        elif template_id == "vue-flask-postgres":
-            return """
-# Build frontend Vue.js
-echo -e "${BLUE}🎨 Build du frontend Vue.js...${NC}"
-cd frontend
-npm install
-npm run build
-cd ..
-
-# Préparer backend Flask
-echo -e "${BLUE}🐍 Préparation du backend Flask...${NC}"
-cd backend
-if [ ! -d venv ]; then
-    python3 -m venv venv
-fi
-source venv/bin/activate
-pip install -r requirements.txt
-cd ..
-
-# Build des images Docker
-echo -e "${BLUE}🐳 Build des images Docker...${NC}"
-docker-compose build
-"""
-        elif template_id == "static-site":
-            return """
-# Optimisation du site statique
-echo -e "${BLUE}🌐 Optimisation du site statique...${NC}"
-cd frontend
-
-# Minification CSS/JS (si outils disponibles)
-if command -v uglifyjs &> /dev/null; then
-    echo -e "${YELLOW}📦 Minification JavaScript...${NC}"
-    find . -name "*.js" -not -path "./node_modules/*" -exec uglifyjs {} -o {} \\;
-fi
-
-if command -v cleancss &> /dev/null; then
-    echo -e "${YELLOW}📦 Minification CSS...${NC}"
-    find . -name "*.css" -not -path "./node_modules/*" -exec cleancss {} -o {} \\;
-fi
-
-cd ..
-
-# Build de l'image Docker
-echo -e "${BLUE}🐳 Build de l'image Docker...${NC}"
-docker-compose build
-"""
-        elif template_id == "api-backend":
-            return """
-# Build backend API
-echo -e "${BLUE}🔌 Build du backend API...${NC}"
-cd backend
-npm install
-# Tests de l'API
-npm test
-cd ..
-
-# Build de l'image Docker
-echo -e "${BLUE}🐳 Build de l'image Docker...${NC}"
-docker-compose build
-"""
-        return ""
-
-    def _get_test_commands(self, template_id):
-        """Retourne les commandes de test selon le template"""
-        if template_id in ["react-node-postgres", "vue-flask-postgres"]:
-            return """
-# Tests frontend
-if [ -d "frontend" ]; then
-    echo -e "${BLUE}🎨 Tests frontend...${NC}"
-    cd frontend
-    npm test -- --watchAll=false
-    cd ..
-fi
-
-# Tests backend
-if [ -d "backend" ]; then
-    echo -e "${BLUE}🔧 Tests backend...${NC}"
-    cd backend
-    npm test || python -m pytest
-    cd ..
-fi
-
-# Tests d'intégration avec Docker
-echo -e "${BLUE}🐳 Tests d'intégration...${NC}"
-docker-compose -f docker-compose.test.yml up --build --abort-on-container-exit
-docker-compose -f docker-compose.test.yml down
-"""
-        elif template_id == "static-site":
-            return """
-# Validation HTML
-if command -v html5validator &> /dev/null; then
-    echo -e "${BLUE}📝 Validation HTML...${NC}"
-    html5validator --root frontend/
-fi
-
-# Tests de liens brisés
-if command -v linkchecker &> /dev/null; then
-    echo -e "${BLUE}🔗 Vérification des liens...${NC}"
-    linkchecker frontend/index.html
-fi
+# Build avant déploiement
+echo -e "${{BLUE}}🔨 Build de l'application...${{NC}}"
+./scripts/build.sh
 
-# Tests de performance
-echo -e "${BLUE}⚡ Tests de performance basiques...${NC}"
-cd frontend
-python3 -m http.server 8000 &
-SERVER_PID=$!
-sleep 2
-curl -s -o /dev/null -w "Status: %{http_code}, Time: %{time_total}s" http://localhost:8000
-kill $SERVER_PID
-cd ..
-"""
-        elif template_id == "api-backend":
-            return """
-# Tests API backend
-echo -e "${BLUE}🔌 Tests API backend...${NC}"
-cd backend
-npm test
-cd ..
+# Tests avant déploiement
+echo -e "${{BLUE}}🧪 Exécution des tests...${{NC}}"
+./scripts/test.sh
 
-# Tests d'intégration API
-echo -e "${BLUE}🧪 Tests d'intégration API...${NC}"
-docker-compose up -d database
-sleep 5
-cd backend
-npm run test:integration || python -m pytest tests/integration/
-cd ..
-docker-compose stop database
+# Déploiement Docker (images construites par build.sh ci-dessus, pas de second build)
+echo -e "${{BLUE}}🐳 Déploiement Docker...${{NC}}"
+docker-compose down
+COMPOSE_DOCKER_CLI_BUILD=1 DOCKER_BUILDKIT=1 docker-compose up -d
+
+# Attendre que les services soient prêts
+echo -e "${{YELLOW}}⏳ Attente de la disponibilité des services...${{NC}}"
+sleep 10
+
+# Vérification de santé
+echo -e "${{BLUE}}🏥 Vérification de la santé des services...${{NC}}"
+{self._get_health_checks(template_id, project_name)}
+
+echo -e "${{GREEN}}✅ Déploiement réussi!${{NC}}"
+echo -e "${{GREEN}}🌐 URL $ENVIRONMENT: https://{project_name}{"-$ENVIRONMENT" if "$ENVIRONMENT" == "staging" else ""}.colaig.fr${{NC}}"
 """
-        return ""
+
+    def _get_build_commands(self, template_id):
+        """Retourne les commandes de build selon le template"""
+        return BUILD_COMMANDS.get(template_id, "")
+
+    def _get_test_commands(self, template_id):
+        """Retourne les commandes de test selon le template"""
+        return TEST_COMMANDS.get(template_id, "")
 
     def _get_health_checks(self, template_id, project_name):
         """Retourne les vérifications de santé selon le template"""
-        checks = []
-        
-        if template_id in ["react-node-postgres", "vue-flask-postgres"]:
-            frontend_port = self.templates[template_id]['ports']['frontend']
-            backend_port = self.templates[template_id]['ports']['backend']
-            checks.append(f'curl -f http://localhost:{frontend_port} > /dev/null || echo -e "${{RED}}❌ Frontend non accessible${{NC}}"')
-            checks.append(f'curl -f http://localhost:{backend_port}/health > /dev/null || echo -e "${{RED}}❌ Backend non accessible${{NC}}"')
-        elif template_id == "static-site":
-            frontend_port = self.templates[template_id]['ports']['frontend']
-            checks.append(f'curl -f http://localhost:{frontend_port} > /dev/null || echo -e "${{RED}}❌ Site non accessible${{NC}}"')
-        elif template_id == "api-backend":
-            backend_port = self.templates[template_id]['ports']['backend']
-            checks.append(f'curl -f http://localhost:{backend_port}/health > /dev/null || echo -e "${{RED}}❌ API non accessible${{NC}}"')
-        
-        return '\n'.join(checks) if checks else 'echo -e "${GREEN}✅ Aucune vérification spécifique${NC}"'
+        return health_checks_body(template_id)
 
     def _apply_compliance_rules(self, project_path, project_name, template_id):
         """Applique les règles de conformité obligatoires"""
@@ -1154,8 +1710,7 @@ npm run test:watch
 npm run test:coverage
 ```
 """
-        with open(os.path.join(tests_path, "README.md"), "w") as f:
-            f.write(test_content)
+        write_text(os.path.join(tests_path, "README.md"), test_content)
 
     def _generate_documentation(self, project_path, project_name, template_id, description):
         """Génère la documentation technique"""
@@ -1194,41 +1749,23 @@ npm run test:coverage
 Voir `.env.example` pour toutes les variables de configuration.
 """
         
-        with open(os.path.join(docs_path, "api.md"), "w") as f:
-            f.write(api_doc)
+        write_text(os.path.join(docs_path, "api.md"), api_doc)
 
     def _generate_project_urls(self, project_name):
         """Génère les URLs du projet"""
-        return {
-            "development": f"http://localhost:3000",
-            "staging": f"https://{project_name}-staging.colaig.fr",
-            "production": f"https://{project_name}.colaig.fr",
-            "api_development": f"http://localhost:5000",
-            "api_staging": f"https://{project_name}-api-staging.colaig.fr",
-            "api_production": f"https://{project_name}-api.colaig.fr"
-        }
+        return {name: url.format(project_name=project_name) for name, url in PROJECT_URLS.items()}
 
     def _get_next_steps(self, template_id):
         """Retourne les prochaines étapes selon le template"""
-        base_steps = [
-            "Modifier le fichier .env selon vos besoins",
-            "Démarrer les services : docker-compose up -d --build",
-            "Tester l'application en local",
-            "Personnaliser le code selon vos besoins"
-        ]
-        
         if template_id in ["react-node-postgres", "vue-flask-postgres"]:
-            base_steps.extend([
-                "Configurer la base de données",
-                "Implémenter les APIs",
-                "Ajouter les tests"
-            ])
-        
-        return base_steps
+            return list(BASE_NEXT_STEPS + FULLSTACK_NEXT_STEPS)
+        return list(BASE_NEXT_STEPS)
 
     # Méthodes de génération spécifiques aux templates
     def _create_react_node_structure(self, project_path, project_name):
         """Crée la structure React + Node.js"""
+        frontend_path = os.path.join(project_path, "frontend")
+        backend_path = os.path.join(project_path, "backend")
         # Frontend package.json
         frontend_package = {
             "name": f"{project_name}-frontend",
@@ -1260,19 +1797,19 @@ Voir `.env.example` pour toutes les variables de configuration.
             }
         }
         
-        with open(os.path.join(project_path, "frontend", "package.json"), "w") as f:
-            json.dump(frontend_package, f, indent=2)
+        write_text(os.path.join(frontend_path, "package.json"), json.dumps(frontend_package, indent=2))
             
         # Frontend Dockerfile
-        frontend_dockerfile = f"""FROM node:18-alpine
+        frontend_dockerfile = """# syntax=docker/dockerfile:1
+FROM node:18-alpine
 
 WORKDIR /app
 
 # Copy package files
 COPY package*.json ./
 
-# Install dependencies
-RUN npm ci --only=production
+# Install dependencies (npm cache kept across builds by BuildKit)
+RUN --mount=type=cache,target=/root/.npm,sharing=locked npm ci --only=production
 
 # Copy source code
 COPY . .
@@ -1289,8 +1826,7 @@ EXPOSE 3000
 CMD ["nginx", "-g", "daemon off;"]
 """
         
-        with open(os.path.join(project_path, "frontend", "Dockerfile"), "w") as f:
-            f.write(frontend_dockerfile)
+        write_text(os.path.join(frontend_path, "Dockerfile"), frontend_dockerfile)
             
         # Nginx config for frontend
         nginx_config = """events {
@@ -1321,43 +1857,38 @@ http {
 }
 """
         
-        with open(os.path.join(project_path, "frontend", "nginx.conf"), "w") as f:
-            f.write(nginx_config)
+        write_text(os.path.join(frontend_path, "nginx.conf"), nginx_config)
             
         # Create basic React structure
-        src_path = os.path.join(project_path, "frontend", "src")
-        os.makedirs(src_path, exist_ok=True)
-        os.makedirs(os.path.join(src_path, "components"), exist_ok=True)
-        os.makedirs(os.path.join(src_path, "pages"), exist_ok=True)
-        os.makedirs(os.path.join(src_path, "services"), exist_ok=True)
+        src_path = os.path.join(frontend_path, "src")
+        make_dirs(src_path, "", "components", "pages", "services")
         
         # App.js
-        app_js = f"""import React from 'react';
-import {{ BrowserRouter as Router, Routes, Route }} from 'react-router-dom';
-import {{ ThemeProvider, createTheme }} from '@mui/material/styles';
+        app_js = """import React from 'react';
+import { BrowserRouter as Router, Routes, Route } from 'react-router-dom';
+import { ThemeProvider, createTheme } from '@mui/material/styles';
 import CssBaseline from '@mui/material/CssBaseline';
 import Home from './pages/Home';
 
 const theme = createTheme();
 
-function App() {{
+function App() {
   return (
-    <ThemeProvider theme={{theme}}>
+    <ThemeProvider theme={theme}>
       <CssBaseline />
       <Router>
         <Routes>
-          <Route path="/" element={{<Home />}} />
+          <Route path="/" element={<Home />} />
         </Routes>
       </Router>
     </ThemeProvider>
   );
-}}
+}
 
 export default App;
 """
         
-        with open(os.path.join(src_path, "App.js"), "w") as f:
-            f.write(app_js)
+        write_text(os.path.join(src_path, "App.js"), app_js)
             
         # Backend package.json
         backend_package = {
@@ -1390,19 +1921,19 @@ export default App;
             }
         }
         
-        with open(os.path.join(project_path, "backend", "package.json"), "w") as f:
-            json.dump(backend_package, f, indent=2)
+        write_text(os.path.join(backend_path, "package.json"), json.dumps(backend_package, indent=2))
             
         # Backend Dockerfile
-        backend_dockerfile = f"""FROM node:18-alpine
+        backend_dockerfile = """# syntax=docker/dockerfile:1
+FROM node:18-alpine
 
 WORKDIR /app
 
 # Copy package files
 COPY package*.json ./
 
-# Install dependencies
-RUN npm ci --only=production
+# Install dependencies (npm cache kept across builds by BuildKit)
+RUN --mount=type=cache,target=/root/.npm,sharing=locked npm ci --only=production
 
 # Copy source code
 COPY . .
@@ -1418,8 +1949,7 @@ EXPOSE 5000
 CMD ["npm", "start"]
 """
         
-        with open(os.path.join(project_path, "backend", "Dockerfile"), "w") as f:
-            f.write(backend_dockerfile)
+        write_text(os.path.join(backend_path, "Dockerfile"), backend_dockerfile)
             
         # Basic server.js
         server_js = f"""const express = require('express');
@@ -1461,11 +1991,12 @@ app.listen(PORT, () => {{
 }});
 """
         
-        with open(os.path.join(project_path, "backend", "server.js"), "w") as f:
-            f.write(server_js)
+        write_text(os.path.join(backend_path, "server.js"), server_js)
 
     def _create_vue_flask_structure(self, project_path, project_name):
         """Crée la structure Vue.js + Flask"""
+        frontend_path = os.path.join(project_path, "frontend")
+        backend_path = os.path.join(project_path, "backend")
         # Frontend package.json pour Vue
         frontend_package = {
             "name": f"{project_name}-frontend",
@@ -1491,19 +2022,19 @@ app.listen(PORT, () => {{
             }
         }
         
-        with open(os.path.join(project_path, "frontend", "package.json"), "w") as f:
-            json.dump(frontend_package, f, indent=2)
+        write_text(os.path.join(frontend_path, "package.json"), json.dumps(frontend_package, indent=2))
             
         # Frontend Dockerfile
-        frontend_dockerfile = f"""FROM node:18-alpine as build
+        frontend_dockerfile = """# syntax=docker/dockerfile:1
+FROM node:18-alpine as build
 
 WORKDIR /app
 
 # Copy package files
 COPY package*.json ./
 
-# Install dependencies
-RUN npm ci
+# Install dependencies (npm cache kept across builds by BuildKit)
+RUN --mount=type=cache,target=/root/.npm,sharing=locked npm ci
 
 # Copy source code
 COPY . .
@@ -1520,20 +2051,15 @@ EXPOSE 8080
 CMD ["nginx", "-g", "daemon off;"]
 """
         
-        with open(os.path.join(project_path, "frontend", "Dockerfile"), "w") as f:
-            f.write(frontend_dockerfile)
+        write_text(os.path.join(frontend_path, "Dockerfile"), frontend_dockerfile)
             
         # Create Vue app structure
-        src_path = os.path.join(project_path, "frontend", "src")
-        os.makedirs(src_path, exist_ok=True)
-        os.makedirs(os.path.join(src_path, "components"), exist_ok=True)
-        os.makedirs(os.path.join(src_path, "views"), exist_ok=True)
-        os.makedirs(os.path.join(src_path, "stores"), exist_ok=True)
-        os.makedirs(os.path.join(src_path, "services"), exist_ok=True)
+        src_path = os.path.join(frontend_path, "src")
+        make_dirs(src_path, "", "components", "views", "stores", "services")
         
         # main.js
-        main_js = f"""import {{ createApp }} from 'vue'
-import {{ createPinia }} from 'pinia'
+        main_js = """import { createApp } from 'vue'
+import { createPinia } from 'pinia'
 import App from './App.vue'
 import router from './router'
 import vuetify from './plugins/vuetify'
@@ -1547,11 +2073,10 @@ app.use(vuetify)
 app.mount('#app')
 """
         
-        with open(os.path.join(src_path, "main.js"), "w") as f:
-            f.write(main_js)
+        write_text(os.path.join(src_path, "main.js"), main_js)
             
         # Backend requirements.txt
-        requirements = f"""Flask==2.2.3
+        requirements = """Flask==2.2.3
 Flask-CORS==3.0.10
 Flask-JWT-Extended==4.4.4
 Flask-SQLAlchemy==3.0.3
@@ -1562,24 +2087,25 @@ marshmallow==3.19.0
 gunicorn==20.1.0
 """
         
-        with open(os.path.join(project_path, "backend", "requirements.txt"), "w") as f:
-            f.write(requirements)
+        write_text(os.path.join(backend_path, "requirements.txt"), requirements)
             
         # Backend Dockerfile
-        backend_dockerfile = f"""FROM python:3.11-slim
+        backend_dockerfile = """# syntax=docker/dockerfile:1
+FROM python:3.11-slim
 
 WORKDIR /app
 
 # Install system dependencies
-RUN apt-get update && apt-get install -y \\
+RUN apt-get update && apt-get install -y --no-install-recommends \\
     gcc \\
+    libc6-dev \\
     && rm -rf /var/lib/apt/lists/*
 
 # Copy requirements
 COPY requirements.txt .
 
-# Install Python dependencies
-RUN pip install --no-cache-dir -r requirements.txt
+# Install Python dependencies (pip cache kept across builds by BuildKit)
+RUN --mount=type=cache,target=/root/.cache/pip,sharing=locked pip install -r requirements.txt
 
 # Copy source code
 COPY . .
@@ -1593,8 +2119,7 @@ EXPOSE 5000
 CMD ["gunicorn", "--bind", "0.0.0.0:5000", "app:app"]
 """
         
-        with open(os.path.join(project_path, "backend", "Dockerfile"), "w") as f:
-            f.write(backend_dockerfile)
+        write_text(os.path.join(backend_path, "Dockerfile"), backend_dockerfile)
             
         # Flask app.py
         app_py = f"""from flask import Flask, request, jsonify
@@ -1633,18 +2158,15 @@ if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
 """
         
-        with open(os.path.join(project_path, "backend", "app.py"), "w") as f:
-            f.write(app_py)
+        write_text(os.path.join(backend_path, "app.py"), app_py)
 
     def _create_static_site_structure(self, project_path, project_name):
         """Crée la structure site statique"""
+        frontend_path = os.path.join(project_path, "frontend")
         # Create full structure
-        css_path = os.path.join(project_path, "frontend", "css")
-        js_path = os.path.join(project_path, "frontend", "js")
-        images_path = os.path.join(project_path, "frontend", "images")
-        os.makedirs(css_path, exist_ok=True)
-        os.makedirs(js_path, exist_ok=True)
-        os.makedirs(images_path, exist_ok=True)
+        css_path = os.path.join(frontend_path, "css")
+        js_path = os.path.join(frontend_path, "js")
+        make_dirs(frontend_path, "css", "js", "images")
         
         # Index HTML
         html_content = f"""<!DOCTYPE html>
@@ -1704,272 +2226,31 @@ if __name__ == '__main__':
             </div>
         </section>
     </main>
-
-    <footer class="footer">
-        <div class="container">
-            <p>&copy; 2024 {project_name}. Tous droits réservés.</p>
-        </div>
-    </footer>
-
-    <script src="js/main.js"></script>
-</body>
-</html>"""
-        
-        with open(os.path.join(project_path, "frontend", "index.html"), "w") as f:
-            f.write(html_content)
-            
-        # CSS principal
-        css_content = f"""/* Reset et base */
-* {{
-    margin: 0;
-    padding: 0;
-    box-sizing: border-box;
-}}
-
-body {{
-    font-family: 'Inter', sans-serif;
-    line-height: 1.6;
-    color: #333;
-}}
-
-.container {{
-    max-width: 1200px;
-    margin: 0 auto;
-    padding: 0 20px;
-}}
-
-/* Header */
-.header {{
-    background: #fff;
-    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-    position: fixed;
-    width: 100%;
-    top: 0;
-    z-index: 1000;
-}}
-
-.nav {{
-    padding: 1rem 0;
-}}
-
-.nav .container {{
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-}}
-
-.nav-brand h1 {{
-    color: #2563eb;
-    font-size: 1.5rem;
-    font-weight: 600;
-}}
-
-.nav-menu {{
-    display: flex;
-    list-style: none;
-    gap: 2rem;
-}}
-
-.nav-menu a {{
-    text-decoration: none;
-    color: #333;
-    font-weight: 500;
-    transition: color 0.3s;
-}}
-
-.nav-menu a:hover {{
-    color: #2563eb;
-}}
-
-/* Sections */
-section {{
-    padding: 80px 0;
-}}
-
-.hero {{
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    color: white;
-    text-align: center;
-    margin-top: 70px;
-}}
-
-.hero h2 {{
-    font-size: 3rem;
-    margin-bottom: 1rem;
-    font-weight: 600;
-}}
-
-.hero p {{
-    font-size: 1.2rem;
-    margin-bottom: 2rem;
-    opacity: 0.9;
-}}
-
-/* Boutons */
-.btn {{
-    display: inline-block;
-    padding: 12px 24px;
-    border: none;
-    border-radius: 6px;
-    font-weight: 500;
-    text-decoration: none;
-    cursor: pointer;
-    transition: all 0.3s;
-}}
-
-.btn-primary {{
-    background: #2563eb;
-    color: white;
-}}
-
-.btn-primary:hover {{
-    background: #1d4ed8;
-    transform: translateY(-2px);
-}}
-
-/* About */
-.about {{
-    background: #f8fafc;
-}}
-
-.about h2 {{
-    text-align: center;
-    margin-bottom: 2rem;
-    font-size: 2.5rem;
-    color: #1e293b;
-}}
-
-/* Contact */
-.contact h2 {{
-    text-align: center;
-    margin-bottom: 2rem;
-    font-size: 2.5rem;
-    color: #1e293b;
-}}
-
-.contact-form {{
-    max-width: 600px;
-    margin: 0 auto;
-    display: grid;
-    gap: 1rem;
-}}
-
-.contact-form input,
-.contact-form textarea {{
-    padding: 12px;
-    border: 1px solid #d1d5db;
-    border-radius: 6px;
-    font-family: inherit;
-}}
-
-.contact-form textarea {{
-    min-height: 120px;
-    resize: vertical;
-}}
-
-/* Footer */
-.footer {{
-    background: #1e293b;
-    color: white;
-    text-align: center;
-    padding: 2rem 0;
-}}
-
-/* Responsive */
-@media (max-width: 768px) {{
-    .nav .container {{
-        flex-direction: column;
-        gap: 1rem;
-    }}
-    
-    .nav-menu {{
-        gap: 1rem;
-    }}
-    
-    .hero h2 {{
-        font-size: 2rem;
-    }}
-    
-    section {{
-        padding: 60px 0;
-    }}
-}}
-"""
-        
-        with open(os.path.join(css_path, "main.css"), "w") as f:
-            f.write(css_content)
-            
-        # JavaScript principal
-        js_content = f"""// {project_name} - Main JavaScript
-
-document.addEventListener('DOMContentLoaded', function() {{
-    // Smooth scrolling for navigation links
-    const navLinks = document.querySelectorAll('.nav-menu a[href^="#"]');
-    
-    navLinks.forEach(link => {{
-        link.addEventListener('click', function(e) {{
-            e.preventDefault();
-            
-            const targetId = this.getAttribute('href').substring(1);
-            const targetSection = document.getElementById(targetId);
-            
-            if (targetSection) {{
-                const headerHeight = document.querySelector('.header').offsetHeight;
-                const targetPosition = targetSection.offsetTop - headerHeight;
-                
-                window.scrollTo({{
-                    top: targetPosition,
-                    behavior: 'smooth'
-                }});
-            }}
-        }});
-    }});
-    
-    // Contact form handling
-    const contactForm = document.querySelector('.contact-form');
-    
-    if (contactForm) {{
-        contactForm.addEventListener('submit', function(e) {{
-            e.preventDefault();
-            
-            // Get form data
-            const formData = new FormData(this);
-            const name = this.querySelector('input[type="text"]').value;
-            const email = this.querySelector('input[type="email"]').value;
-            const message = this.querySelector('textarea').value;
-            
-            // Simple validation
-            if (!name || !email || !message) {{
-                alert('Veuillez remplir tous les champs');
-                return;
-            }}
+
+    <footer class="footer">
+        <div class="container">
+            <p>&copy; 2024 {project_name}. Tous droits réservés.</p>
+        </div>
+    </footer>
+
+    <script src="js/main.js"></script>
+</body>
+</html>"""
+        
+        write_text(os.path.join(frontend_path, "index.html"), html_content)
             
-            // Simulate form submission
-            alert('Merci pour votre message ! Nous vous répondrons bientôt.');
-            this.reset();
-        }});
-    }}
-    
-    // Add scroll effect to header
-    window.addEventListener('scroll', function() {{
-        const header = document.querySelector('.header');
+        # CSS principal
+        css_content = STATIC_SITE_CSS
         
-        if (window.scrollY > 100) {{
-            header.style.background = 'rgba(255, 255, 255, 0.95)';
-            header.style.backdropFilter = 'blur(10px)';
-        }} else {{
-            header.style.background = '#fff';
-            header.style.backdropFilter = 'none';
-        }}
-    }});
-}});
-"""
+        write_text(os.path.join(css_path, "main.css"), css_content)
+            
+        # JavaScript principal
+        js_content = f"// {project_name} - Main JavaScript\n" + STATIC_SITE_JS
         
-        with open(os.path.join(js_path, "main.js"), "w") as f:
-            f.write(js_content)
+        write_text(os.path.join(js_path, "main.js"), js_content)
             
         # Dockerfile for static site
-        dockerfile_content = f"""FROM nginx:alpine
+        dockerfile_content = """FROM nginx:alpine
 
 # Copy static files
 COPY . /usr/share/nginx/html
@@ -1982,8 +2263,7 @@ EXPOSE 80
 CMD ["nginx", "-g", "daemon off;"]
 """
         
-        with open(os.path.join(project_path, "frontend", "Dockerfile"), "w") as f:
-            f.write(dockerfile_content)
+        write_text(os.path.join(frontend_path, "Dockerfile"), dockerfile_content)
             
         # Nginx config
         nginx_config = """events {
@@ -2016,21 +2296,18 @@ http {
 }
 """
         
-        with open(os.path.join(project_path, "frontend", "nginx.conf"), "w") as f:
-            f.write(nginx_config)
+        write_text(os.path.join(frontend_path, "nginx.conf"), nginx_config)
 
     def _create_api_backend_structure(self, project_path, project_name):
         """Crée la structure API backend"""
+        backend_path = os.path.join(project_path, "backend")
         # Create detailed backend structure
-        src_path = os.path.join(project_path, "backend", "src")
+        src_path = os.path.join(backend_path, "src")
         controllers_path = os.path.join(src_path, "controllers")
-        models_path = os.path.join(src_path, "models")
         routes_path = os.path.join(src_path, "routes")
-        middleware_path = os.path.join(src_path, "middleware")
-        utils_path = os.path.join(src_path, "utils")
         
-        for path in [src_path, controllers_path, models_path, routes_path, middleware_path, utils_path]:
-            os.makedirs(path, exist_ok=True)
+        make_dirs(src_path, "", "controllers", "models", "routes", "middleware", "utils")
+        make_dirs(backend_path, "docs")
             
         # Package.json pour l'API
         backend_package = {
@@ -2074,19 +2351,19 @@ http {
             }
         }
         
-        with open(os.path.join(project_path, "backend", "package.json"), "w") as f:
-            json.dump(backend_package, f, indent=2)
+        write_text(os.path.join(backend_path, "package.json"), json.dumps(backend_package, indent=2))
             
         # Dockerfile
-        dockerfile_content = f"""FROM node:18-alpine
+        dockerfile_content = """# syntax=docker/dockerfile:1
+FROM node:18-alpine
 
 WORKDIR /app
 
 # Copy package files
 COPY package*.json ./
 
-# Install dependencies
-RUN npm ci --only=production
+# Install dependencies (npm cache kept across builds by BuildKit)
+RUN --mount=type=cache,target=/root/.npm,sharing=locked npm ci --only=production
 
 # Copy source code
 COPY . .
@@ -2108,8 +2385,7 @@ HEALTHCHECK --interval=30s --timeout=3s --start-period=5s --retries=3 \\
 CMD ["npm", "start"]
 """
         
-        with open(os.path.join(project_path, "backend", "Dockerfile"), "w") as f:
-            f.write(dockerfile_content)
+        write_text(os.path.join(backend_path, "Dockerfile"), dockerfile_content)
             
         # Main server.js
         server_js = f"""const express = require('express');
@@ -2119,29 +2395,12 @@ const rateLimit = require('express-rate-limit');
 const morgan = require('morgan');
 const swaggerUi = require('swagger-ui-express');
 const YAML = require('yamljs');
-const winston = require('winston');
+const logger = require('./src/utils/logger');
 require('dotenv').config();
 
 const app = express();
 const PORT = process.env.PORT || 5000;
 
-// Configure logger
-const logger = winston.createLogger({{
-  level: 'info',
-  format: winston.format.combine(
-    winston.format.timestamp(),
-    winston.format.errors({{ stack: true }}),
-    winston.format.json()
-  ),
-  transports: [
-    new winston.transports.File({{ filename: 'logs/error.log', level: 'error' }}),
-    new winston.transports.File({{ filename: 'logs/combined.log' }}),
-    new winston.transports.Console({{
-      format: winston.format.simple()
-    }})
-  ]
-}});
-
 // Rate limiting
 const limiter = rateLimit({{
   windowMs: 15 * 60 * 1000, // 15 minutes
@@ -2219,8 +2478,32 @@ app.listen(PORT, () => {{
 module.exports = app;
 """
         
-        with open(os.path.join(project_path, "backend", "server.js"), "w") as f:
-            f.write(server_js)
+        write_text(os.path.join(backend_path, "server.js"), server_js)
+            
+        # Logger partagé par server.js et les contrôleurs
+        logger_js = """const winston = require('winston');
+
+// Configure logger
+const logger = winston.createLogger({
+  level: 'info',
+  format: winston.format.combine(
+    winston.format.timestamp(),
+    winston.format.errors({ stack: true }),
+    winston.format.json()
+  ),
+  transports: [
+    new winston.transports.File({ filename: 'logs/error.log', level: 'error' }),
+    new winston.transports.File({ filename: 'logs/combined.log' }),
+    new winston.transports.Console({
+      format: winston.format.simple()
+    })
+  ]
+});
+
+module.exports = logger;
+"""
+        
+        write_text(os.path.join(src_path, "utils", "logger.js"), logger_js)
             
         # Routes index
         routes_index = f"""const express = require('express');
@@ -2251,14 +2534,13 @@ router.use('/users', userRoutes);
 module.exports = router;
 """
         
-        with open(os.path.join(routes_path, "index.js"), "w") as f:
-            f.write(routes_index)
+        write_text(os.path.join(routes_path, "index.js"), routes_index)
             
         # Auth routes
-        auth_routes = f"""const express = require('express');
+        auth_routes = """const express = require('express');
 const router = express.Router();
 const authController = require('../controllers/authController');
-const {{ validateLogin }} = require('../middleware/validation');
+const { validateLogin } = require('../middleware/validation');
 
 /**
  * @swagger
@@ -2303,20 +2585,24 @@ router.post('/login', validateLogin, authController.login);
  *   post:
  *     summary: User registration
  *     tags: [Authentication]
+ *     responses:
+ *       201:
+ *         description: User created
+ *       400:
+ *         description: User already exists
  */
 router.post('/register', authController.register);
 
 module.exports = router;
 """
         
-        with open(os.path.join(routes_path, "auth.js"), "w") as f:
-            f.write(auth_routes)
+        write_text(os.path.join(routes_path, "auth.js"), auth_routes)
             
         # Users routes
-        users_routes = f"""const express = require('express');
+        users_routes = """const express = require('express');
 const router = express.Router();
 const userController = require('../controllers/userController');
-const {{ authenticateToken }} = require('../middleware/auth');
+const { authenticateToken } = require('../middleware/auth');
 
 /**
  * @swagger
@@ -2334,112 +2620,206 @@ router.get('/', authenticateToken, userController.getAllUsers);
 
 /**
  * @swagger
- * /api/v1/users/{{id}}:
+ * /api/v1/users/{id}:
  *   get:
  *     summary: Get user by ID
  *     tags: [Users]
  *     security:
  *       - bearerAuth: []
+ *     parameters:
+ *       - in: path
+ *         name: id
+ *         required: true
+ *         schema:
+ *           type: integer
+ *     responses:
+ *       200:
+ *         description: User details
+ *       404:
+ *         description: User not found
  */
 router.get('/:id', authenticateToken, userController.getUserById);
 
 module.exports = router;
 """
         
-        with open(os.path.join(routes_path, "users.js"), "w") as f:
-            f.write(users_routes)
+        write_text(os.path.join(routes_path, "users.js"), users_routes)
+
+        # Documentation Swagger déjà générée: server.js la sert sans attendre "npm run docs:generate"
+        swagger_yaml = f"""openapi: 3.0.0
+info:
+  title: {project_name} API
+  version: 1.0.0
+  description: API Backend for {project_name}
+components:
+  securitySchemes:
+    bearerAuth:
+      type: http
+      scheme: bearer
+      bearerFormat: JWT
+paths:
+  /api/v1/auth/login:
+    post:
+      summary: User login
+      tags: [Authentication]
+      requestBody:
+        required: true
+        content:
+          application/json:
+            schema:
+              type: object
+              required:
+                - email
+                - password
+              properties:
+                email:
+                  type: string
+                  format: email
+                password:
+                  type: string
+                  minLength: 6
+      responses:
+        200:
+          description: Login successful
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  token:
+                    type: string
+                  user:
+                    type: object
+  /api/v1/auth/register:
+    post:
+      summary: User registration
+      tags: [Authentication]
+      responses:
+        201:
+          description: User created
+        400:
+          description: User already exists
+  /api/v1/users:
+    get:
+      summary: Get all users
+      tags: [Users]
+      security:
+        - bearerAuth: []
+      responses:
+        200:
+          description: List of users
+  /api/v1/users/{{id}}:
+    get:
+      summary: Get user by ID
+      tags: [Users]
+      security:
+        - bearerAuth: []
+      parameters:
+        - in: path
+          name: id
+          required: true
+          schema:
+            type: integer
+      responses:
+        200:
+          description: User details
+        404:
+          description: User not found
+"""
+        
+        write_text(os.path.join(backend_path, "docs", "swagger.yaml"), swagger_yaml)
             
         # Controllers
-        auth_controller = f"""const jwt = require('jsonwebtoken');
+        auth_controller = """const jwt = require('jsonwebtoken');
 const bcrypt = require('bcryptjs');
-const {{ User }} = require('../models');
-const {{ validationResult }} = require('express-validator');
+const { User } = require('../models');
+const { validationResult } = require('express-validator');
+const logger = require('../utils/logger');
 
-class AuthController {{
-  async login(req, res) {{
-    try {{
+class AuthController {
+  async login(req, res) {
+    try {
       const errors = validationResult(req);
-      if (!errors.isEmpty()) {{
-        return res.status(400).json({{ errors: errors.array() }});
-      }}
+      if (!errors.isEmpty()) {
+        return res.status(400).json({ errors: errors.array() });
+      }
 
-      const {{ email, password }} = req.body;
+      const { email, password } = req.body;
       
       // Find user
-      const user = await User.findOne({{ where: {{ email }} }});
-      if (!user) {{
-        return res.status(401).json({{ error: 'Invalid credentials' }});
-      }}
+      const user = await User.findOne({ where: { email } });
+      if (!user) {
+        return res.status(401).json({ error: 'Invalid credentials' });
+      }
 
       // Check password
       const validPassword = await bcrypt.compare(password, user.password);
-      if (!validPassword) {{
-        return res.status(401).json({{ error: 'Invalid credentials' }});
-      }}
+      if (!validPassword) {
+        return res.status(401).json({ error: 'Invalid credentials' });
+      }
 
       // Generate token
       const token = jwt.sign(
-        {{ userId: user.id, email: user.email }},
+        { userId: user.id, email: user.email },
         process.env.JWT_SECRET,
-        {{ expiresIn: '24h' }}
+        { expiresIn: '24h' }
       );
 
-      res.json({{
+      res.json({
         token,
-        user: {{
+        user: {
           id: user.id,
           email: user.email,
           name: user.name
-        }}
-      }});
+        }
+      });
 
-    }} catch (error) {{
-      console.error('Login error:', error);
-      res.status(500).json({{ error: 'Internal server error' }});
-    }}
-  }}
+    } catch (error) {
+      logger.error('Login error', { error: error.message, stack: error.stack });
+      res.status(500).json({ error: 'Internal server error' });
+    }
+  }
 
-  async register(req, res) {{
-    try {{
-      const {{ name, email, password }} = req.body;
+  async register(req, res) {
+    try {
+      const { name, email, password } = req.body;
 
       // Check if user exists
-      const existingUser = await User.findOne({{ where: {{ email }} }});
-      if (existingUser) {{
-        return res.status(400).json({{ error: 'User already exists' }});
-      }}
+      const existingUser = await User.findOne({ where: { email } });
+      if (existingUser) {
+        return res.status(400).json({ error: 'User already exists' });
+      }
 
       // Hash password
       const hashedPassword = await bcrypt.hash(password, 10);
 
       // Create user
-      const user = await User.create({{
+      const user = await User.create({
         name,
         email,
         password: hashedPassword
-      }});
+      });
 
-      res.status(201).json({{
+      res.status(201).json({
         message: 'User created successfully',
-        user: {{
+        user: {
           id: user.id,
           name: user.name,
           email: user.email
-        }}
-      }});
+        }
+      });
 
-    }} catch (error) {{
-      console.error('Registration error:', error);
-      res.status(500).json({{ error: 'Internal server error' }});
-    }}
-  }}
-}}
+    } catch (error) {
+      logger.error('Registration error', { error: error.message, stack: error.stack });
+      res.status(500).json({ error: 'Internal server error' });
+    }
+  }
+}
 
 module.exports = new AuthController();
 """
         
-        with open(os.path.join(controllers_path, "authController.js"), "w") as f:
-            f.write(auth_controller)
+        write_text(os.path.join(controllers_path, "authController.js"), auth_controller)
 
     def _get_react_node_architecture(self, project_name, template_info):
         """Architecture spécifique React + Node.js + PostgreSQL"""
@@ -2623,203 +3003,7 @@ module.exports = new AuthController();
 
     def _get_template_specific_guidance(self, template_id, project_name, template_info):
         """Guidance spécifique selon le template"""
-        if template_id == "react-node-postgres":
-            return f"""
-
-## React + Node.js Specific Guidance
-
-### Frontend Development
-```bash
-# Start React development server
-cd frontend && npm start
-
-# Build for production
-cd frontend && npm run build
-
-# Run frontend tests
-cd frontend && npm test
-```
-
-### Backend Development  
-```bash
-# Start Node.js API server
-cd backend && npm run dev
-
-# Run database migrations
-cd backend && npm run migrate
-
-# Seed database with sample data
-cd backend && npm run seed
-```
-
-### Common Patterns
-- Use React hooks for component logic
-- Implement proper error boundaries
-- Use React Query for API state management
-- Follow REST API conventions in backend
-- Implement proper authentication flows
-
-### Database Operations
-```bash
-# Create new migration
-cd backend && npm run migration:create add_users_table
-
-# Run migrations
-cd backend && npm run migrate
-
-# Rollback last migration  
-cd backend && npm run migrate:rollback
-```"""
-
-        elif template_id == "vue-flask-postgres":
-            return f"""
-
-## Vue.js + Flask Specific Guidance
-
-### Frontend Development
-```bash
-# Start Vue development server
-cd frontend && npm run serve
-
-# Build for production
-cd frontend && npm run build
-
-# Run frontend tests
-cd frontend && npm run test:unit
-```
-
-### Backend Development
-```bash
-# Start Flask development server
-cd backend && python app.py
-
-# Run database migrations
-cd backend && flask db upgrade
-
-# Create new migration
-cd backend && flask db migrate -m "description"
-```
-
-### Common Patterns
-- Use Vue 3 Composition API for better code organization
-- Implement Pinia stores for state management
-- Use Flask Blueprints for API organization
-- Implement proper CORS configuration
-- Use SQLAlchemy relationships effectively
-
-### Database Operations
-```bash
-# Initialize database
-cd backend && flask db init
-
-# Create migration
-cd backend && flask db migrate -m "Add user table"
-
-# Apply migrations
-cd backend && flask db upgrade
-```"""
-
-        elif template_id == "static-site":
-            return f"""
-
-## Static Site Specific Guidance
-
-### Development
-```bash
-# Serve locally for development
-cd frontend && python -m http.server 8000
-
-# Or use live-server for auto-reload
-npx live-server frontend/
-```
-
-### Build Process
-```bash
-# Optimize images
-cd frontend && npm run optimize:images
-
-# Minify CSS and JS
-cd frontend && npm run build
-
-# Deploy to production
-./scripts/deploy.sh production
-```
-
-### Performance Optimization
-- Optimize images and use modern formats (WebP, AVIF)
-- Implement lazy loading for images
-- Minify CSS and JavaScript
-- Use CDN for assets
-- Implement proper caching headers
-
-### SEO Best Practices
-- Use semantic HTML structure
-- Implement proper meta tags
-- Add structured data markup
-- Optimize for Core Web Vitals
-- Create XML sitemap"""
-
-        elif template_id == "api-backend":
-            return f"""
-
-## API Backend Specific Guidance
-
-### API Development
-```bash
-# Start API server in development
-cd backend && npm run dev
-
-# Generate API documentation
-cd backend && npm run docs:generate
-
-# Run API tests
-cd backend && npm test
-```
-
-### Database Operations
-```bash
-# Run migrations
-cd backend && npm run migrate
-
-# Seed database
-cd backend && npm run seed
-
-# Create new migration
-cd backend && npm run migration:create
-```
-
-### API Best Practices
-- Follow RESTful conventions
-- Implement proper HTTP status codes
-- Use consistent error response format
-- Implement rate limiting
-- Add request/response logging
-- Use API versioning
-
-### Security
-- Implement JWT authentication
-- Use HTTPS in production
-- Validate all inputs
-- Implement rate limiting
-- Add CORS configuration
-- Use security headers
-
-### Testing Strategy
-```bash
-# Unit tests
-npm run test:unit
-
-# Integration tests  
-npm run test:integration
-
-# End-to-end tests
-npm run test:e2e
-
-# Test coverage
-npm run test:coverage
-```"""
-
-        return ""
+        return TEMPLATE_GUIDANCE.get(template_id, "")
 
 
 # Instance globale de l'agent meta
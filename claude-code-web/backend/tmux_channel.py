@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Canal de commandes tmux persistant
+Un seul client tmux en mode contrôle (-C) reçoit les commandes sur son entrée
+standard, au lieu de lancer un processus tmux par commande.
+"""
+
+import os
+import select
+import subprocess
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+class TmuxCommandChannel:
+    """Client tmux en mode contrôle réutilisé pour exécuter des commandes"""
+
+    def __init__(self, socket_path, session_name='claude-web-control', timeout=5):
+        self.socket_path = socket_path
+        self.session_name = session_name
+        self.timeout = timeout
+        self.process = None
+        self.buffer = b''
+        self.sequence = 0
+        self.written = False
+        self.lock = threading.Lock()
+
+    def run(self, args):
+        """Exécute une commande tmux (argv) et renvoie un CompletedProcess, ou None si le canal est indisponible
+        
+        None (repli possible sur un processus tmux) n'est renvoyé que si rien de la commande n'a été
+        écrit: une fois la commande transmise, tmux a pu l'exécuter et la relancer la dupliquerait.
+        """
+        if any('\n' in arg or '\r' in arg for arg in args):
+            # Une ligne du mode contrôle ne peut pas contenir de retour à la ligne
+            return None
+        with self.lock:
+            try:
+                if self.process is None or self.process.poll() is not None:
+                    self._start()
+            except Exception as e:
+                logger.error(f"Canal de commandes tmux indisponible: {str(e)}")
+                self._stop()
+                return None
+            try:
+                return self._execute(args)
+            except Exception as e:
+                logger.error(f"Canal de commandes tmux interrompu: {str(e)}")
+                written = self.written
+                self._stop()
+                if not written:
+                    return None
+                return subprocess.CompletedProcess(args, 1, "", f"{str(e)}\n")
+
+    def close(self):
+        """Ferme le client en mode contrôle"""
+        with self.lock:
+            self._stop()
+
+    def _start(self):
+        """Démarre le client en mode contrôle sur une session dédiée"""
+        self._stop()
+        # La session dédiée exécute une commande inactive plutôt qu'un shell de connexion
+        self.process = subprocess.Popen(
+            ["tmux", "-S", self.socket_path, "-C", "new-session", "-A", "-s", self.session_name, "cat"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        # Synchronisation: ignorer tout ce qui précède la première réponse
+        self._execute(["display-message", "-p", "ready"])
+
+    def _stop(self):
+        """Arrête le client en mode contrôle s'il existe"""
+        if self.process is not None:
+            try:
+                self.process.stdin.close()
+            except Exception:
+                pass
+            if self.process.poll() is None:
+                self.process.terminate()
+            try:
+                self.process.wait(timeout=1)
+            except Exception:
+                pass
+        self.process = None
+        self.buffer = b''
+
+    def _execute(self, args):
+        """Envoie une ligne de commandes suivie d'un marqueur et lit les réponses jusqu'au marqueur"""
+        self.sequence += 1
+        marker = f"claude-web-marker-{os.getpid()}-{self.sequence}"
+        line = " ".join(";" if arg == ";" else quote_tmux_argument(arg) for arg in args)
+        payload = f"{line}\ndisplay-message -p {quote_tmux_argument(marker)}\n"
+        self._write(payload.encode('utf-8'))
+
+        stdout = []
+        stderr = []
+        returncode = 0
+        while True:
+            header = self._readline()
+            if not header.startswith('%begin '):
+                # Notification (%window-add, %output...) hors d'un bloc de réponse
+                if header.startswith('%exit'):
+                    raise EOFError("client tmux terminé")
+                continue
+            fields = header.split(' ')
+            own = len(fields) > 3 and fields[3] == '1'
+            block = []
+            while True:
+                body = self._readline()
+                parts = body.split(' ')
+                if parts[0] in ('%end', '%error') and parts[1:3] == fields[1:3]:
+                    break
+                block.append(body)
+            if not own:
+                continue
+            if block == [marker] and parts[0] == '%end':
+                break
+            if parts[0] == '%error':
+                returncode = 1
+                stderr.extend(block)
+            else:
+                stdout.extend(block)
+
+        return subprocess.CompletedProcess(
+            args,
+            returncode,
+            "".join(f"{output}\n" for output in stdout),
+            "".join(f"{output}\n" for output in stderr)
+        )
+
+    def _write(self, data):
+        """Écrit toute la commande sur l'entrée du client (le tube peut être non bloquant sous gevent)"""
+        self.written = False
+        fd = self.process.stdin.fileno()
+        view = memoryview(data)
+        while view:
+            try:
+                count = os.write(fd, view)
+            except BlockingIOError:
+                _, ready, _ = select.select([], [fd], [], self.timeout)
+                if not ready:
+                    raise TimeoutError("le client tmux n'accepte plus de commandes")
+                continue
+            self.written = True
+            view = view[count:]
+
+    def _readline(self):
+        """Lit une ligne sur la sortie du client en respectant le délai maximal"""
+        fd = self.process.stdout.fileno()
+        while b'\n' not in self.buffer:
+            ready, _, _ = select.select([fd], [], [], self.timeout)
+            if not ready:
+                raise TimeoutError("pas de réponse du client tmux")
+            try:
+                chunk = os.read(fd, 65536)
+            except (BlockingIOError, InterruptedError):
+                # Réveil sans données (tube non bloquant): attendre à nouveau
+                continue
+            if not chunk:
+                raise EOFError("client tmux terminé")
+            self.buffer += chunk
+        line, self.buffer = self.buffer.split(b'\n', 1)
+        return line.decode('utf-8', errors='replace')
+
+def quote_tmux_argument(arg):
+    """Protège un argument pour l'analyseur de commandes tmux (guillemets simples, sans expansion)"""
+    return "'" + arg.replace("'", "'\\''") + "'"